@@ -34,10 +34,20 @@ def register():
         module.register()
 
     preferences.update_sidebar_category(bpy.context.preferences.addons[__package__].preferences, bpy.context)
+    preferences.update_profiler(bpy.context.preferences.addons[__package__].preferences, bpy.context)
 
     # HANDLERS
+    bpy.app.handlers.load_post.append(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.undo_post.append(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.redo_post.append(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.load_post.append(functions.handler.repair_keymesh_objects)
     bpy.app.handlers.load_post.append(functions.handler.update_keymesh)
+    bpy.app.handlers.frame_change_pre.append(functions.handler.update_keymesh_pre)
     bpy.app.handlers.frame_change_post.append(functions.handler.update_keymesh)
+    bpy.app.handlers.depsgraph_update_post.append(functions.handler.update_keymesh_caches)
+    bpy.app.handlers.render_init.append(functions.handler.compile_render_schedule)
+    bpy.app.handlers.render_complete.append(functions.handler.clear_render_schedule)
+    bpy.app.handlers.render_cancel.append(functions.handler.clear_render_schedule)
     if bpy.app.version > (4, 3, 0):
         bpy.app.handlers.blend_import_post.append(functions.handler.append_keymesh)
 
@@ -47,11 +57,24 @@ def unregister():
         module.unregister()
 
     # HANDLERS
+    bpy.app.handlers.load_post.remove(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.undo_post.remove(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.redo_post.remove(functions.handler.reset_keymesh_caches)
+    bpy.app.handlers.load_post.remove(functions.handler.repair_keymesh_objects)
     bpy.app.handlers.load_post.remove(functions.handler.update_keymesh)
+    bpy.app.handlers.frame_change_pre.remove(functions.handler.update_keymesh_pre)
     bpy.app.handlers.frame_change_post.remove(functions.handler.update_keymesh)
+    bpy.app.handlers.depsgraph_update_post.remove(functions.handler.update_keymesh_caches)
+    bpy.app.handlers.render_init.remove(functions.handler.compile_render_schedule)
+    bpy.app.handlers.render_complete.remove(functions.handler.clear_render_schedule)
+    bpy.app.handlers.render_cancel.remove(functions.handler.clear_render_schedule)
     if bpy.app.version > (4, 3, 0):
         bpy.app.handlers.blend_import_post.remove(functions.handler.append_keymesh)
 
+    # TIMERS
+    if bpy.app.timers.is_registered(functions.handler.flush_active_index_sync):
+        bpy.app.timers.unregister(functions.handler.flush_active_index_sync)
+
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,47 @@
+"""
+NOTE: This script isn't imported by the add-on. It's executed by background Blender processes
+started by "Bake to Keymesh" operator when baking in parallel, with a temporary copy of the
+.blend file opened, and with add-ons disabled. Each process bakes its own part of the frame range
+and writes baked meshes into a separate .blend file, which is then appended by the operator.
+
+Usage:
+    blender -b --factory-startup <file.blend> --python bake_worker.py -- '<json arguments>'
+"""
+
+import bpy
+import json
+import sys
+
+
+def main():
+    args = json.loads(sys.argv[sys.argv.index("--") + 1])
+
+    scene = bpy.context.scene
+    obj = bpy.data.objects[args["object"]]
+
+    meshes = set()
+    for frame in args["frames"]:
+        scene.frame_set(frame)
+
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = bpy.data.meshes.new_from_object(eval_obj,
+                                               preserve_all_data_layers=True,
+                                               depsgraph=depsgraph)
+
+        # Material slots are kept empty, and reassigned by name in the original file, instead of appending materials again.
+        mesh["keymesh_bake_frame"] = frame
+        mesh["keymesh_bake_materials"] = [mat.name if mat else "" for mat in mesh.materials]
+        for i in range(len(mesh.materials)):
+            mesh.materials[i] = None
+
+        meshes.add(mesh)
+
+        # Progress is read from the log by the operator (`bake_worker_marker`).
+        print("Keymesh: baked frame", frame, flush=True)
+
+    bpy.data.libraries.write(args["output"], meshes, fake_user=True)
+
+
+if __name__ == "__main__":
+    main()
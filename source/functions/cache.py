@@ -0,0 +1,243 @@
+import bpy
+
+
+#### ------------------------------ /block_lookup/ ------------------------------ ####
+
+"""
+NOTE: Maps are keyed by objects `session_uid` and store positions in `obj.keymesh.blocks`
+instead of references to data-blocks, because Python references to IDs become invalid
+after undo and can't be safely kept between frames. Every hit is validated against
+blocks `["Data"]` property, so a stale map is rebuilt instead of returning wrong block.
+"""
+_block_maps = {}
+
+
+def _build_block_map(obj) -> dict:
+    """Returns `dict` of Keymesh block indices (`["Data"]`) and their position in `obj.keymesh.blocks`."""
+
+    block_map = {}
+    for i, block in enumerate(obj.keymesh.blocks):
+        if block.block is None:
+            continue
+        block_index = block.block.keymesh.get("Data", None)
+        if block_index is None:
+            continue
+        block_map[block_index] = i
+
+    return block_map
+
+
+def get_block_map(obj) -> dict:
+    """Returns cached `["Data"] -> position` map of Keymesh blocks for the object, building it if needed."""
+
+    blocks_count = len(obj.keymesh.blocks)
+    cached = _block_maps.get(obj.session_uid, None)
+    if cached is None or cached[0] != blocks_count:
+        cached = (blocks_count, _build_block_map(obj))
+        _block_maps[obj.session_uid] = cached
+
+    return cached[1]
+
+
+def lookup_block_registry(obj, index):
+    """
+    Returns the item in objects Keymesh blocks registry (`KeymeshBlocks`) whose block
+    has the given `index`, or `None` if the object doesn't have such block.
+    """
+
+    for attempt in range(2):
+        position = get_block_map(obj).get(index, None)
+        if position is None:
+            return None
+
+        block = obj.keymesh.blocks[position]
+        if block.block is not None and block.block.keymesh.get("Data", None) == index:
+            return block
+
+        # Blocks were moved or changed outside of Keymesh, rebuild the map once.
+        invalidate_block_map(obj)
+
+    return None
+
+
+def lookup_block(obj, index):
+    """Returns the Keymesh block (object data) with the given `index`, or `None` if the object doesn't have it."""
+
+    block = lookup_block_registry(obj, index)
+    if block is None:
+        return None
+
+    return block.block
+
+
+def invalidate_block_map(obj=None):
+    """Drops the cached block map for the given object, or for all objects if `obj` is `None`."""
+
+    if obj is None:
+        _block_maps.clear()
+    else:
+        _block_maps.pop(obj.session_uid, None)
+
+
+
+#### ------------------------------ /object_registry/ ------------------------------ ####
+
+"""
+NOTE: Registry stores Keymesh objects grouped by scene and view layer, so that frame handler
+doesn't have to scan every object in the view layer. Objects are stored as `(name, library)`
+keys instead of references for the same reason as block maps. Groups are built lazily and
+dropped whenever objects are added/removed from collections, so registry heals itself.
+"""
+_registry = {}
+
+
+def object_key(obj) -> tuple:
+    """Returns the key that `bpy.data.objects` can be indexed with to get the object back."""
+
+    return (obj.name, obj.library.filepath if obj.library else None)
+
+
+def _build_registry_group(view_layer) -> list:
+    return [object_key(obj) for obj in view_layer.objects if obj.keymesh.active]
+
+
+def get_keymesh_objects(scene, view_layer) -> list:
+    """Returns all Keymesh objects in the given view layer from the registry."""
+
+    group_key = (scene.name, view_layer.name)
+    keys = _registry.get(group_key, None)
+    rebuilt = keys is None
+    if rebuilt:
+        keys = _registry[group_key] = _build_registry_group(view_layer)
+
+    objects = [bpy.data.objects.get(key, None) for key in keys]
+    if not rebuilt and any(obj is None or not obj.keymesh.active for obj in objects):
+        # Object was renamed or removed since the group was built.
+        keys = _registry[group_key] = _build_registry_group(view_layer)
+        objects = [bpy.data.objects.get(key, None) for key in keys]
+
+    return [obj for obj in objects if obj is not None]
+
+
+def unregister_keymesh_object(obj):
+    """Removes the object from every registry group it's in."""
+
+    key = object_key(obj)
+    for keys in _registry.values():
+        if key in keys:
+            keys.remove(key)
+
+
+def invalidate_registry():
+    """Drops all registry groups, so that they're rebuilt on the next frame change."""
+
+    _registry.clear()
+
+
+
+#### ------------------------------ /id_registry/ ------------------------------ ####
+
+"""
+NOTE: Keymesh IDs of all objects in the .blend file, mapped to keys of objects that use them.
+It's built with one scan of `bpy.data.objects` the first time it's needed, and then kept up to date
+when IDs are assigned and removed, so that uniqueness of IDs can be checked without scanning.
+"""
+_id_registry = {}
+_id_registry_built = False
+
+# Last Keymesh ID given out, seeded from the .blend file the first time a new ID is needed.
+_last_id = None
+
+
+def _build_id_registry():
+    global _id_registry_built
+
+    _id_registry.clear()
+    for obj in bpy.data.objects:
+        if not obj.keymesh.active:
+            continue
+        km_id = obj.keymesh.get("ID", None)
+        if km_id is not None:
+            _id_registry.setdefault(km_id, set()).add(object_key(obj))
+
+    _id_registry_built = True
+
+
+def _ensure_id_registry():
+    if not _id_registry_built:
+        _build_id_registry()
+
+
+def get_id_users(km_id) -> list:
+    """Returns the list of objects that have the given Keymesh ID."""
+
+    _ensure_id_registry()
+
+    users = [bpy.data.objects.get(key, None) for key in _id_registry.get(km_id, ())]
+    if any(obj is None or obj.keymesh.get("ID", None) != km_id for obj in users):
+        # Object was renamed or removed since it was registered.
+        _build_id_registry()
+        users = [bpy.data.objects.get(key, None) for key in _id_registry.get(km_id, ())]
+
+    return [obj for obj in users if obj is not None]
+
+
+def highest_id() -> int:
+    """Returns the highest Keymesh ID used by objects in the .blend file, or 0 if there are none."""
+
+    _ensure_id_registry()
+    return max(_id_registry, default=0)
+
+
+def next_object_id(stored_id) -> int:
+    """
+    Returns the next unused Keymesh ID. `stored_id` is a function that returns the last ID
+    stored in the .blend file, and it's only called once, when the counter is seeded.
+    """
+
+    global _last_id
+
+    if _last_id is None:
+        _last_id = max(highest_id(), stored_id())
+
+    _last_id += 1
+    return _last_id
+
+
+def register_object_id(obj):
+    """Adds objects Keymesh ID to the registry."""
+
+    global _last_id
+
+    km_id = obj.keymesh.get("ID", None)
+    if km_id is None:
+        return
+
+    # Objects appended with higher IDs than the last given one.
+    if _last_id is not None and km_id > _last_id:
+        _last_id = km_id
+
+    if not _id_registry_built:
+        return
+
+    # Object might have been registered with the ID it had before.
+    unregister_object_id(obj)
+    _id_registry.setdefault(km_id, set()).add(object_key(obj))
+
+
+def unregister_object_id(obj):
+    """Removes the object from the registry, no matter which ID it was registered with."""
+
+    key = object_key(obj)
+    for km_id in [km_id for km_id, keys in _id_registry.items() if key in keys]:
+        _id_registry[km_id].discard(key)
+        if not _id_registry[km_id]:
+            del _id_registry[km_id]
+
+
+def invalidate_id_registry():
+    global _id_registry_built, _last_id
+
+    _id_registry.clear()
+    _id_registry_built = False
+    _last_id = None
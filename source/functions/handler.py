@@ -1,9 +1,26 @@
 import bpy
+import math
+import numpy
 import os
+import time
 from .. import __package__ as base_package
 
+from .cache import (
+    lookup_block,
+    invalidate_block_map,
+    get_keymesh_objects,
+    invalidate_registry,
+    object_key,
+    register_object_id,
+    invalidate_id_registry,
+)
 from .object import (
     new_object_id,
+    repair_next_keymesh_index,
+)
+from .profiler import (
+    profiler_clock,
+    record_sample,
 )
 from .poll import (
     is_keymesh_object,
@@ -15,67 +32,507 @@ from .thumbnail import (
 )
 from .timeline import (
     get_keymesh_fcurve,
+    can_evaluate_directly,
+    get_keymesh_timing,
+    keymesh_value_at_frame,
+    invalidate_fcurves,
+    invalidate_timing,
 )
 
 
 #### ------------------------------ /frame_handler/ ------------------------------ ####
 
+"""
+NOTE: Objects whose Keymesh value can be read directly from the f-curve are resolved in
+`frame_change_pre`, before the scene is evaluated, so that changing their data doesn't cause
+another evaluation. Session UIDs of those objects are stored here, and `frame_change_post`
+handler only resolves the rest (objects driven or animated with NLA).
+"""
+_pre_resolved = set()
+
+# Last whole frames that were resolved (by scene name).
+_last_frames = {}
+
+# Values of objects resolved in `frame_change_post` on whole frames (by objects session UID).
+_whole_frame_values = {}
+
+# Last resolved Keymesh values of objects (by objects session UID).
+_last_resolved = {}
+
+# Keys of objects whose Frame Picker is synced after the playback stops.
+_pending_ui_sync = set()
+
+# Mesh settings that are kept on object-level when "Persistent Sculpt Mode Settings" are enabled.
+persistent_mesh_settings = (
+    "remesh_voxel_size",
+    "remesh_voxel_adaptivity",
+    "use_mirror_x",
+    "use_mirror_y",
+    "use_mirror_z",
+)
+
+
+def _assign_keymesh_block(obj, block, prefs):
+    """
+    Assigns the Keymesh block to an object and syncs the active index of the Frame Picker.
+    Nothing is written if the block is already objects data, which is the case for most frames.
+    Returns `True` if object data was changed.
+    """
+
+    if block is None or obj.data == block:
+        return False
+
+    # store_data_that_is_not_persistent
+    persistent = prefs.persistent_settings and obj.type == 'MESH'
+    if persistent:
+        settings = {prop: getattr(obj.data, prop) for prop in persistent_mesh_settings}
+
+    obj.data = block
+
+    # restore_inpersistent_data
+    if persistent:
+        for prop, value in settings.items():
+            if getattr(block, prop) != value:
+                setattr(block, prop, value)
+
+
+    _request_active_index_sync(obj)
+
+    return True
+
+
+def _is_playing_back() -> bool:
+    """Checks if animation is playing or scrubbed in any window, or if it's being rendered."""
+
+    for window in bpy.context.window_manager.windows:
+        if window.screen.is_animation_playing or window.screen.is_scrubbing:
+            return True
+
+    return bpy.app.is_job_running('RENDER')
+
+
+def _request_active_index_sync(obj):
+    """
+    Syncs the Frame Picker with objects data. During playback, scrubbing, and rendering
+    objects are only collected, and synced once, with timer, after playback is stopped.
+    NOTE: Syncing the grid view regenerates enum items, which checks every thumbnail on the disk.
+    """
+
+    if bpy.app.background:
+        return
+
+    if _is_playing_back():
+        _pending_ui_sync.add(object_key(obj))
+        if not bpy.app.timers.is_registered(flush_active_index_sync):
+            bpy.app.timers.register(flush_active_index_sync, first_interval=0.25)
+    else:
+        _sync_active_index(obj)
+
+
+def flush_active_index_sync():
+    """Timer function that syncs the Frame Picker of objects collected during playback, once it stops."""
+
+    if _is_playing_back():
+        return 0.25
+
+    for key in _pending_ui_sync:
+        obj = bpy.data.objects.get(key, None)
+        if obj is not None and is_keymesh_object(obj):
+            _sync_active_index(obj)
+    _pending_ui_sync.clear()
+
+    return None
+
+
+def _sync_active_index(obj):
+    """Makes objects current data the active block in the Frame Picker."""
+
+    ui_index = obj.keymesh.blocks_active_index
+    if ui_index is not None:
+        block_index = obj.keymesh.blocks.find(obj.data.name)
+
+        if (ui_index != block_index) and (block_index >= 0):
+            if obj.keymesh.grid_view:
+                obj.keymesh.blocks_grid = str(block_index)
+            else:
+                obj.keymesh.blocks_active_index = int(block_index)
+
+
+def _resolve_keymesh_value(obj, value, prefs, start=None):
+    """
+    Assigns the Keymesh block with the given index to an object. When the value is the same
+    as the last resolved one and object still has that block, it's skipped without lookups.
+    `start` is the time object started resolving at, and it's only given when profiling.
+    """
+
+    if value is None:
+        return
+    if _last_resolved.get(obj.session_uid, None) == value and obj.data.keymesh.get("Data", None) == value:
+        if start is not None:
+            record_sample(obj, time.perf_counter() - start, 0.0, swapped=False, cache_hit=True)
+        return
+
+    block = lookup_block(obj, value)
+    if block is not None:
+        _last_resolved[obj.session_uid] = value
+
+    if start is None:
+        _assign_keymesh_block(obj, block, prefs)
+    else:
+        resolved = time.perf_counter()
+        swapped = _assign_keymesh_block(obj, block, prefs)
+        record_sample(obj, resolved - start, time.perf_counter() - resolved, swapped=swapped, cache_hit=False)
+
+
+def _resolution_frame(scene) -> int:
+    """Returns the whole frame that Keymesh blocks are resolved for, based on the current subframe."""
+
+    if scene.keymesh.subframe_switch == 'CENTER':
+        return math.floor(scene.frame_current_final + 0.5)
+    else:
+        return scene.frame_current
+
+
+def _slot_key(obj) -> tuple:
+    """Returns the key of objects action and action slot, or `None` if it doesn't have an action."""
+
+    anim_data = obj.animation_data
+    if anim_data is None or anim_data.action is None:
+        return None
+
+    slot = getattr(anim_data, "action_slot", None)
+    return (anim_data.action.session_uid, slot.handle if slot else 0)
+
+
+def _animated_keymesh_objects(scene, view_layer):
+    """
+    Yields animated Keymesh objects in the view layer along with their Keymesh f-curve.
+    F-curve is looked up once for all objects that share the same action slot.
+    """
+
+    fcurves = {}
+    for obj in get_keymesh_objects(scene, view_layer):
+        if not is_keymesh_object(obj):
+            continue
+        if not obj.keymesh.animated:
+            continue
+
+        slot_key = _slot_key(obj)
+        fcurve = fcurves.get(slot_key, None)
+        if fcurve is None:
+            fcurve = get_keymesh_fcurve(obj)
+            if slot_key is not None:
+                fcurves[slot_key] = fcurve
+
+        if not fcurve:
+            obj.keymesh.animated = False
+            continue
+        if fcurve.mute:
+            continue
+
+        yield obj, fcurve
+
+
+@bpy.app.handlers.persistent
+def update_keymesh_pre(scene, depsgraph=None):
+    """Resolves Keymesh blocks from f-curves before the scene is evaluated for the new frame."""
+
+    """NOTE: Objects are collected from the view layer of the context scene, so other scenes (e.g. scene strips) are skipped."""
+    if scene != bpy.context.scene:
+        return
+
+    _pre_resolved.clear()
+    if not scene.keymesh.enable_handler:
+        return
+
+    # Subframes (Motion Blur)
+    frame = _resolution_frame(scene)
+    subframe_skip = scene.frame_subframe != 0.0 and _last_frames.get(scene.name, None) == frame
+    _last_frames[scene.name] = frame
+
+    # Render Schedule
+    schedule = _render_schedules.get(scene.name, None)
+    if schedule is not None:
+        schedule["resolved"] = _apply_render_schedule(schedule, frame) and schedule["complete"]
+        if schedule["resolved"]:
+            return
+
+    prefs = bpy.context.preferences.addons[base_package].preferences
+
+    """
+    NOTE: Objects that share the action slot share the Keymesh value too, so it's
+    resolved once for the whole group, and each object only looks up its own block.
+    """
+    slot_values = {}
+    for obj, fcurve in _animated_keymesh_objects(scene, bpy.context.view_layer):
+        if obj.session_uid in _pre_resolved:
+            continue
+        if not can_evaluate_directly(scene, obj):
+            continue
+
+        """
+        NOTE: Keyframed values are constant, so every subframe of the same whole frame resolves to the
+        same block and object is only marked as resolved. Driven and NLA-animated objects aren't skipped.
+        """
+        if subframe_skip:
+            _pre_resolved.add(obj.session_uid)
+            continue
+
+        start = profiler_clock()
+        slot_key = _slot_key(obj)
+        if slot_key in slot_values:
+            value = slot_values[slot_key]
+        else:
+            value = slot_values[slot_key] = keymesh_value_at_frame(obj, fcurve, frame)
+
+        _resolve_keymesh_value(obj, value, prefs, start)
+        _pre_resolved.add(obj.session_uid)
+
+
+def _subframe_value(scene, obj, value):
+    """
+    Returns the value that object resolved in `frame_change_post` should use on the current subframe.
+    NOTE: Those values are evaluated on the actual subframe, while pre handler rounds subframes in 'CENTER' mode.
+    Motion blur evaluates the whole frame before its subframes, so value from the whole frame that subframe is
+    rounded to is used instead, in order for all objects keyed on the same frame to switch on the same subframe.
+    """
+
+    if scene.frame_subframe == 0.0:
+        _whole_frame_values[obj.session_uid] = (scene.name, scene.frame_current, value)
+        return value
+
+    if scene.keymesh.subframe_switch == 'CENTER':
+        stored = _whole_frame_values.get(obj.session_uid, None)
+        if stored is not None and stored[:2] == (scene.name, _resolution_frame(scene)):
+            return stored[2]
+
+    return value
+
+
 @bpy.app.handlers.persistent
 def update_keymesh(scene, override=False):
     prefs = bpy.context.preferences.addons[base_package].preferences
 
-    if bpy.context.scene.keymesh.enable_handler or override == True:
-        for obj in bpy.context.view_layer.objects:
-            if not is_keymesh_object(obj):
-                continue
-            if not obj.keymesh.animated:
+    # `load_post` handlers aren't given a scene.
+    if not isinstance(scene, bpy.types.Scene):
+        scene = bpy.context.scene
+    if scene != bpy.context.scene:
+        return
+
+    # Objects resolved in `frame_change_pre` are only skipped once, for the frame they were resolved on.
+    pre_resolved = _pre_resolved.copy()
+    _pre_resolved.clear()
+
+    # Every object was resolved from the render schedule.
+    schedule = _render_schedules.get(scene.name, None)
+    if override != True and schedule is not None and schedule["resolved"]:
+        return
+
+    if scene.keymesh.enable_handler or override == True:
+        for obj, fcurve in _animated_keymesh_objects(scene, bpy.context.view_layer):
+            if override != True and obj.session_uid in pre_resolved:
                 continue
 
-            fcurve = get_keymesh_fcurve(obj)
-            if not fcurve:
-                obj.keymesh.animated = False
+            # Find correct Keymesh block for an object (with same index).
+            start = profiler_clock()
+            value = obj.keymesh["Keymesh Data"]
+            if override != True:
+                value = _subframe_value(scene, obj, value)
+            _resolve_keymesh_value(obj, value, prefs, start)
+
+            # Forced updates (from operators) also sync the UI when block didn't change.
+            if override == True:
+                _sync_active_index(obj)
+
+
+
+#### ------------------------------ /refresh/ ------------------------------ ####
+
+def refresh_keymesh_objects(objects, shared=True):
+    """
+    Re-resolves Keymesh blocks of the given objects for the current frame, without changing frames.
+    If `shared` is True, Keymesh objects that use the same action slot are refreshed as well.
+    """
+
+    scene = bpy.context.scene
+    prefs = bpy.context.preferences.addons[base_package].preferences
+    frame = _resolution_frame(scene)
+
+    keys = {object_key(obj) for obj in objects}
+    slots = {_slot_key(obj) for obj in objects} if shared else set()
+    slots.discard(None)
+
+    needs_evaluation = False
+    for obj, fcurve in _animated_keymesh_objects(scene, bpy.context.view_layer):
+        if object_key(obj) not in keys and _slot_key(obj) not in slots:
+            continue
+
+        if not can_evaluate_directly(scene, obj):
+            needs_evaluation = True
+            continue
+
+        _resolve_keymesh_value(obj, keymesh_value_at_frame(obj, fcurve, frame), prefs)
+        if not bpy.app.background:
+            _sync_active_index(obj)
+
+    if needs_evaluation:
+        """
+        NOTE: Values of driven objects and objects animated with NLA are only known after the scene
+        is evaluated, so current frame is re-evaluated once (frame handlers resolve their blocks).
+        Last resolved frame is forgotten, otherwise handlers would skip the frame if it's a subframe.
+        """
+        _last_frames.pop(scene.name, None)
+        scene.frame_set(scene.frame_current, subframe=scene.frame_subframe)
+
+
+
+#### ------------------------------ /render_handler/ ------------------------------ ####
+
+"""
+NOTE: When rendering an animation, timeline of each Keymesh object is compiled into `frame -> block`
+dict when render starts, so that frame handler only has to look the block up and assign it.
+Schedules hold references to objects and blocks, so they're only compiled for background renders
+and renders with locked interface, when data can't be changed (or removed) while rendering.
+"""
+_render_schedules = {}
+
+
+def _compile_object_schedule(obj, fcurve, frames: list) -> dict:
+    """Returns `dict` of frames and Keymesh blocks that object should have on them."""
+
+    timing = get_keymesh_timing(obj, fcurve)
+    if timing["count"] == 0 or not timing["constant"]:
+        return None
+
+    indices = numpy.searchsorted(timing["frames"], frames, side='right') - 1
+    values = timing["values"][numpy.maximum(indices, 0)].astype(int).tolist()
+
+    blocks = {}
+    object_schedule = {}
+    for frame, value in zip(frames, values):
+        if value not in blocks:
+            blocks[value] = lookup_block(obj, value)
+        if blocks[value] is not None:
+            object_schedule[frame] = blocks[value]
+
+    return object_schedule
+
+
+@bpy.app.handlers.persistent
+def compile_render_schedule(scene, *args):
+    """Compiles timelines of all animated Keymesh objects in the scene when render starts."""
+
+    if not scene.keymesh.enable_handler:
+        return
+    if not (bpy.app.background or scene.render.use_lock_interface):
+        return
+
+    frames = list(range(scene.frame_start, scene.frame_end + 1, scene.frame_step))
+    if scene.frame_current not in frames:
+        frames.append(scene.frame_current)
+
+    schedule = {"complete": True, "resolved": False, "objects": []}
+    compiled = set()
+    for view_layer in scene.view_layers:
+        if not view_layer.use:
+            continue
+
+        for obj, fcurve in _animated_keymesh_objects(scene, view_layer):
+            if obj.session_uid in compiled:
                 continue
-            if fcurve.mute:
+            compiled.add(obj.session_uid)
+
+            object_schedule = None
+            if can_evaluate_directly(scene, obj):
+                object_schedule = _compile_object_schedule(obj, fcurve, frames)
+
+            if object_schedule is None:
+                # Object will be resolved by the regular frame handler.
+                schedule["complete"] = False
                 continue
 
-            # store_data_that_is_not_persistent
-            if prefs.persistent_settings and obj.type == 'MESH':
-                remesh_voxel_size = obj.data.remesh_voxel_size
-                remesh_voxel_adaptivity = obj.data.remesh_voxel_adaptivity
-                symmetry_x = obj.data.use_mirror_x
-                symmetry_y = obj.data.use_mirror_y
-                symmetry_z = obj.data.use_mirror_z
+            schedule["objects"].append((obj, object_schedule))
+
+    _render_schedules[scene.name] = schedule
+
+
+def _apply_render_schedule(schedule, frame: int) -> bool:
+    """Assigns scheduled blocks to objects. Returns `False` if some objects don't have the frame in schedule."""
+
+    resolved = True
+    for obj, object_schedule in schedule["objects"]:
+        block = object_schedule.get(frame, None)
+        if block is None:
+            resolved = False
+            continue
+
+        if obj.data != block:
+            obj.data = block
+        _pre_resolved.add(obj.session_uid)
+
+    return resolved
 
-            # Find correct Keymesh block for an object (with same index).
-            correct_block = None
-            obj_keymesh_data = obj.keymesh["Keymesh Data"]
-            for block in obj.keymesh.blocks:
-                if block.block.keymesh["Data"] == obj_keymesh_data:
-                    correct_block = block.block
-                    break
 
-            if correct_block:
-                obj.data = correct_block
+@bpy.app.handlers.persistent
+def clear_render_schedule(scene, *args):
+    """Drops compiled render schedule of the scene when render is completed or cancelled."""
+
+    _render_schedules.pop(scene.name, None)
+
 
-            # restore_inpersistent_data
-            if prefs.persistent_settings and obj.type == 'MESH':
-                obj.data.remesh_voxel_size = remesh_voxel_size
-                obj.data.remesh_voxel_adaptivity = remesh_voxel_adaptivity
-                obj.data.use_mirror_x = symmetry_x
-                obj.data.use_mirror_y = symmetry_y
-                obj.data.use_mirror_z = symmetry_z
 
+#### ------------------------------ /load_handler/ ------------------------------ ####
+
+@bpy.app.handlers.persistent
+def reset_keymesh_caches(*args):
+    """
+    Drops session caches that refer to data of the previously opened file.
+    NOTE: Also called after undo and redo, which can restore keyframes without changing their count.
+    """
 
-            # Update active index.
-            ui_index = obj.keymesh.blocks_active_index
-            if ui_index is not None:
-                block_index = obj.keymesh.blocks.find(obj.data.name)
+    invalidate_block_map()
+    invalidate_registry()
+    invalidate_id_registry()
+    invalidate_fcurves()
+    invalidate_timing()
+    _last_resolved.clear()
+    _pending_ui_sync.clear()
+    _render_schedules.clear()
+    _last_frames.clear()
+    _whole_frame_values.clear()
+    _pre_resolved.clear()
+
+
+
+@bpy.app.handlers.persistent
+def repair_keymesh_objects(*args):
+    """Stores the next block index on Keymesh objects from files created with older versions of Keymesh."""
 
-                if (ui_index != block_index) and (block_index >= 0):
-                    if obj.keymesh.grid_view:
-                        obj.keymesh.blocks_grid = str(block_index)
-                    else:
-                        obj.keymesh.blocks_active_index = int(block_index)
+    for obj in bpy.data.objects:
+        if obj.library is not None:
+            continue
+        if obj.keymesh.active and obj.keymesh.blocks_next_index < 0:
+            repair_next_keymesh_index(obj)
+
+
+
+#### ------------------------------ /depsgraph_handler/ ------------------------------ ####
+
+@bpy.app.handlers.persistent
+def update_keymesh_caches(scene, depsgraph):
+    """
+    Drops the Keymesh objects registry when objects might have been added to or removed from
+    view layers, and cached f-curves and keyframes of actions that were edited.
+    """
+
+    if depsgraph.id_type_updated('COLLECTION') or depsgraph.id_type_updated('SCENE'):
+        invalidate_registry()
+
+    if depsgraph.id_type_updated('ACTION'):
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Action):
+                invalidate_fcurves(update.id.original)
+                invalidate_timing(update.id.original)
 
 
 
@@ -89,6 +546,7 @@ def append_keymesh(lapp_context):
 
     is_linking = True if 'LINK' in options else False
     has_keymesh = False
+    appended_objects = []
 
     for item in items:
         type = item.id_type
@@ -102,14 +560,18 @@ def append_keymesh(lapp_context):
                 continue
 
             has_keymesh = True
+            appended_objects.append(obj)
             km_id = obj.keymesh.get("ID", None)
             new_id = None
 
             # Ensure Unique ID
-            if is_unique_id(obj, km_id) == False:
+            """NOTE: Linked objects can't be given a new ID, their blocks are resolved through their own registry."""
+            if obj.library is None and is_unique_id(obj, km_id) == False:
                 new_id = new_object_id()
                 obj.keymesh["ID"] = new_id
+            register_object_id(obj)
 
+            invalidate_block_map(obj)
             for block in obj.keymesh.blocks:
                 data = block.block
 
@@ -149,10 +611,10 @@ def append_keymesh(lapp_context):
 
     # update_frame_handler
     if has_keymesh:
+        invalidate_registry()
+
         """
         NOTE: `update_keymesh()` is not working because `obj.keymesh.get("Keymesh Data")`
         is set to the frame of the original file.
         """
-        current_frame = bpy.context.scene.frame_current
-        bpy.context.scene.frame_set(current_frame + 1)
-        bpy.context.scene.frame_set(current_frame)
+        refresh_keymesh_objects(appended_objects)
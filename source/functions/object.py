@@ -1,6 +1,14 @@
 import bpy
-import random
 
+from .cache import (
+    lookup_block_registry,
+    invalidate_block_map,
+    invalidate_registry,
+    unregister_keymesh_object,
+    next_object_id,
+    register_object_id,
+    unregister_object_id,
+)
 from .poll import (
     is_keymesh_object,
     has_shared_action_slot,
@@ -9,6 +17,7 @@ from .poll import (
 from .timeline import (
     get_keymesh_fcurve,
     remove_fcurve,
+    remove_keyframes,
     delete_empty_action,
 )
 
@@ -16,12 +25,19 @@ from .timeline import (
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
 def new_object_id() -> int:
-    """Returns random unused number between 1-1000 to be used as Keymesh ID."""
+    """
+    Returns the new unused number to be used as Keymesh ID. IDs are given out incrementally,
+    and the last given ID is stored in all scenes of the .blend file, so that IDs of removed
+    objects are never reused.
+    """
+
+    def stored_id():
+        return max((scene.keymesh.last_id for scene in bpy.data.scenes), default=0)
 
-    id = random.randint(1, 1000)
-    used_ids = {o.keymesh.get("ID") for o in bpy.data.objects if o.keymesh.get("ID") is not None}
-    while id in used_ids:
-        id = random.randint(1, 1000)
+    id = next_object_id(stored_id)
+    for scene in bpy.data.scenes:
+        if scene.library is None:
+            scene.keymesh.last_id = id
 
     return id
 
@@ -29,19 +45,29 @@ def new_object_id() -> int:
 def get_next_keymesh_index(obj) -> int:
     """Get the appropriate index for the newly created/added Keymesh block."""
 
-    if obj.keymesh.get("Keymesh Data") == None or obj.keymesh.get("Keymesh Data") == -1:
-        return 0
-    else:
-        # Find the largest index in objects Keymesh registry.
-        largest_value = 0
-        for block in obj.keymesh.blocks:
-            block_index: int = block.block.keymesh.get("Data")
-            if block_index is None:
-                continue
-            if block_index > largest_value:
-                largest_value = block_index
+    if obj.keymesh.blocks_next_index < 0:
+        repair_next_keymesh_index(obj)
+
+    return obj.keymesh.blocks_next_index
+
+
+def repair_next_keymesh_index(obj):
+    """
+    Calculates the next block index from the largest index in objects Keymesh registry.
+    Only needed for objects created before the index was stored on the object.
+    """
+
+    largest_value = -1
+    for block in obj.keymesh.blocks:
+        if block.block is None:
+            continue
+        block_index: int = block.block.keymesh.get("Data")
+        if block_index is None:
+            continue
+        if block_index > largest_value:
+            largest_value = block_index
 
-        return largest_value + 1
+    obj.keymesh.blocks_next_index = largest_value + 1
 
 
 def list_block_users(block) -> list:
@@ -65,6 +91,8 @@ def assign_keymesh_id(obj, animate=False):
     if obj.keymesh.active == False:
         obj.keymesh.active = True
         obj.keymesh["ID"] = new_object_id()
+        register_object_id(obj)
+        invalidate_registry()
 
     if animate:
         if obj.keymesh.animated == False:
@@ -79,6 +107,9 @@ def insert_block(obj, block, index: int, name: str=None):
     if name == None:
         name = block.name
 
+    if obj.keymesh.blocks_next_index < 0:
+        repair_next_keymesh_index(obj)
+
     # Give the block Keymesh properties.
     block.keymesh["ID"] = obj.keymesh["ID"]
     block.keymesh["Data"] = index
@@ -88,6 +119,14 @@ def insert_block(obj, block, index: int, name: str=None):
     block_registry = obj.keymesh.blocks.add()
     block_registry.block = block
     block_registry.name = name
+    invalidate_block_map(obj)
+
+    """
+    NOTE: Next index is never lowered when blocks are removed, because keyframes of removed
+    blocks are kept in shared action slots, and new blocks shouldn't take over those keyframes.
+    """
+    if index >= obj.keymesh.blocks_next_index:
+        obj.keymesh.blocks_next_index = index + 1
 
 
 def remove_block(obj, block):
@@ -98,15 +137,14 @@ def remove_block(obj, block):
     for index, mesh_ref in enumerate(obj.keymesh.blocks):
         if mesh_ref.block == block:
             obj.keymesh.blocks.remove(index)
+    invalidate_block_map(obj)
 
     # Remove Keyframes
     fcurve = get_keymesh_fcurve(obj)
     if fcurve:
         """If objects action slot has other users keyframes are not removed, as others might need it."""
         if not has_shared_action_slot(obj, check_index=True, index=block_index):
-            for keyframe in reversed(fcurve.keyframe_points.values()):
-                if keyframe.co_ui[1] == block_index:
-                    fcurve.keyframe_points.remove(keyframe)
+            remove_keyframes(obj, fcurve, block_index)
 
             # Remove animated properties if the last keyframe was removed.
             has_other_keys = bool(fcurve.keyframe_points)
@@ -124,9 +162,13 @@ def remove_keymesh_properties(obj):
     """Removes all Keymesh properties from an object, making it regular object."""
 
     if is_keymesh_object(obj):
+        unregister_keymesh_object(obj)
+        unregister_object_id(obj)
         obj.keymesh.active = False
         obj.keymesh.animated = False
         obj.keymesh.blocks.clear()
+        obj.keymesh.blocks_next_index = -1
+        invalidate_block_map(obj)
         if obj.keymesh.get("ID", None):
             del obj.keymesh["ID"]
         if obj.keymesh.get("Keymesh Data", None):
@@ -266,6 +308,11 @@ def get_active_keymesh_block(obj):
     if not is_keymesh_object(obj):
         return None
 
+    block = lookup_block_registry(obj, obj.data.keymesh.get("Data", None))
+    if block is not None and block.block == obj.data:
+        return block
+
+    # Fall back to the full search for data that isn't registered with its index.
     for block in obj.keymesh.blocks:
         if obj.data == block.block:
             return block
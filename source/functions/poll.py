@@ -1,5 +1,10 @@
 import bpy
 
+from .cache import (
+    lookup_block_registry,
+    get_id_users,
+)
+
 
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
@@ -98,11 +103,7 @@ def has_shared_action_slot(obj, check_index=False, index: str=0) -> bool:
 def has_index(obj, index) -> bool:
     """Checks if the object has a Keymesh block with the given index."""
 
-    for block in obj.keymesh.blocks:
-        if block.block.keymesh.get("Data", None) == index:
-            return True
-
-    return False
+    return lookup_block_registry(obj, index) is not None
 
 
 def is_unique_id(obj, id) -> bool:
@@ -110,12 +111,8 @@ def is_unique_id(obj, id) -> bool:
     Checks if any of the objects in the .blend file have the same Keymesh ID as `obj`.
     """
 
-    for ob in bpy.data.objects:
-        if ob == obj:
-            continue
-        if not ob.keymesh.active:
-            continue
-        if ob.keymesh.get("ID", None) == id:
+    for ob in get_id_users(id):
+        if ob != obj:
             return False
 
     return True
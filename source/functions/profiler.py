@@ -0,0 +1,97 @@
+import bpy
+import time
+from collections import deque
+
+
+#### ------------------------------ /profiler/ ------------------------------ ####
+
+"""
+NOTE: Opt-in instrumentation of the frame handler. When enabled, each resolved Keymesh object
+records how long it took to find its block and to swap it into a ring buffer, so that the
+buffer only holds the most recent frames of playback. When disabled, handler only pays
+for one function call per object.
+"""
+_enabled = False
+_samples = deque(maxlen=8192)
+
+# Stats are only recalculated when new samples were recorded since they were last requested.
+_stats = []
+_stats_dirty = False
+
+
+def set_profiling(state: bool):
+    global _enabled
+    _enabled = state
+
+
+def profiler_clock():
+    """Returns the current time if profiling is enabled, `None` otherwise."""
+
+    if _enabled:
+        return time.perf_counter()
+
+    return None
+
+
+def record_sample(obj, resolve_time: float, swap_time: float, swapped: bool, cache_hit: bool):
+    """Stores the time (in seconds) object spent in the frame handler."""
+
+    global _stats_dirty
+
+    _samples.append((bpy.context.scene.frame_current, obj.name,
+                     resolve_time, swap_time, swapped, cache_hit))
+    _stats_dirty = True
+
+
+def clear_samples():
+    global _stats_dirty
+
+    _samples.clear()
+    _stats_dirty = True
+
+
+def has_samples() -> bool:
+    return len(_samples) > 0
+
+
+def get_samples() -> list[dict]:
+    return [{"frame": frame,
+             "object": name,
+             "resolve_ms": resolve_time * 1000,
+             "swap_ms": swap_time * 1000,
+             "swapped": swapped,
+             "cache_hit": cache_hit} for frame, name, resolve_time, swap_time, swapped, cache_hit in _samples]
+
+
+def get_stats() -> list[dict]:
+    """
+    Returns rolling stats for each object in the ring buffer, sorted by the total time
+    they spent in the frame handler (most expensive first).
+    """
+
+    global _stats, _stats_dirty
+
+    if not _stats_dirty:
+        return _stats
+
+    stats = {}
+    for frame, name, resolve_time, swap_time, swapped, cache_hit in _samples:
+        if name not in stats:
+            stats[name] = {"object": name, "samples": 0, "swaps": 0, "cache_hits": 0,
+                           "resolve_ms": 0.0, "swap_ms": 0.0}
+
+        item = stats[name]
+        item["samples"] += 1
+        item["swaps"] += int(swapped)
+        item["cache_hits"] += int(cache_hit)
+        item["resolve_ms"] += resolve_time * 1000
+        item["swap_ms"] += swap_time * 1000
+
+    for item in stats.values():
+        item["total_ms"] = item["resolve_ms"] + item["swap_ms"]
+        item["average_ms"] = item["total_ms"] / item["samples"]
+
+    _stats = sorted(stats.values(), key=lambda item: item["total_ms"], reverse=True)
+    _stats_dirty = False
+
+    return _stats
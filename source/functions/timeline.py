@@ -1,63 +1,266 @@
 import bpy
+import numpy
 
 
 #### ------------------------------ /general/ ------------------------------ ####
 
-def ensure_channelbag(data_block):
+def find_channelbag(data_block):
     """
-    Returns the channelbag of f-curves for a given ID, or `None` if the ID doesn't
-    have an animation data, an action, or a slot.
+    Returns the channelbag of f-curves for a given ID's action slot, or `None` if it doesn't exist.
+    It never creates a channelbag, so it's safe to use in handlers.
     """
 
     anim_data = data_block.animation_data
-    if anim_data is None:
+    if anim_data is None or anim_data.action is None:
         return None
 
-    action = anim_data.action
-    if action is None:
-        return None
-    if action.is_empty:
+    slot = anim_data.action_slot
+    if slot is None:
         return None
 
-    if anim_data.action_slot is None:
-        return None
+    for layer in anim_data.action.layers:
+        for strip in layer.strips:
+            channelbag = strip.channelbag(slot)
+            if channelbag is not None:
+                return channelbag
 
-    from bpy_extras.anim_utils import action_ensure_channelbag_for_slot
-    channelbag = action_ensure_channelbag_for_slot(action, anim_data.action_slot)
+    return None
 
-    return channelbag
 
+"""
+NOTE: Position of the f-curve in the f-curves collection is cached per action, action slot,
+and data-path, so that actions with thousands of f-curves aren't scanned on every frame change.
+Positions are validated against f-curves data-path on every hit. Misses are cached together
+with the number of f-curves, so they're looked up again only when f-curves are added or removed.
+"""
+_fcurve_cache = {}
 
-def get_fcurve(obj, path: str):
-    """Returns the f-curve with a given data-path from objects action, or `None` if it doesn't exists."""
-
-    if not obj.animation_data or not obj.animation_data.action:
-        return None
 
+def _fcurves_collection(obj):
     if bpy.app.version >= (5, 0, 0):
         # Slotted actions check.
-        channelbag = ensure_channelbag(obj)
-        for fcurve in channelbag.fcurves:
-            if fcurve.data_path == path:
-                return fcurve
+        channelbag = find_channelbag(obj)
+        return channelbag.fcurves if channelbag else None
     else:
         # Blender 4.5 LTS or older check.
-        for fcurve in obj.animation_data.action.fcurves:
+        return obj.animation_data.action.fcurves
+
+
+def get_fcurve(obj, path: str):
+    """
+    Returns the f-curve with a given data-path from objects action, or `None` if it doesn't exists.
+    Doesn't create any data (i.e. channelbags) if it doesn't exist.
+    """
+
+    anim_data = obj.animation_data
+    if not anim_data or not anim_data.action:
+        return None
+
+    fcurves = _fcurves_collection(obj)
+    if fcurves is None:
+        return None
+
+    key = _timing_key(obj, path)
+    cached = _fcurve_cache.get(key, None)
+    if cached is not None:
+        index, count = cached
+        if index is None:
+            if count == len(fcurves):
+                return None
+        elif index < len(fcurves):
+            fcurve = fcurves[index]
             if fcurve.data_path == path:
                 return fcurve
 
+    # Cache miss, or f-curves were changed since it was cached.
+    for index, fcurve in enumerate(fcurves):
+        if fcurve.data_path == path:
+            _fcurve_cache[key] = (index, len(fcurves))
+            return fcurve
+
+    _fcurve_cache[key] = (None, len(fcurves))
+    return None
+
+
+def invalidate_fcurves(action=None):
+    """Drops cached f-curve positions for the given action, or for all actions if `action` is `None`."""
+
+    if action is None:
+        _fcurve_cache.clear()
+    else:
+        for key in [key for key in _fcurve_cache if key[0] == action.session_uid]:
+            del _fcurve_cache[key]
+
 
 def insert_keyframe(obj, frame, path: str, constant=True):
     """Inserts the keyframe on an object, on a given frame, for a given data-path."""
 
     obj.keyframe_insert(data_path=path, frame=frame)
+    invalidate_timing(obj.animation_data.action)
 
     # Set Constant Interpolation
     if constant:
         fcurve = get_fcurve(obj, path)
         if fcurve:
-            for kf in fcurve.keyframe_points:
-                kf.interpolation = 'CONSTANT'
+            _set_constant_interpolation(fcurve)
+
+
+def insert_keyframes(obj, frames, values, path: str, constant=True):
+    """
+    Inserts keyframes on an object for a given data-path on all given frames at once,
+    with given values. Values of keyframes that already exist on those frames are replaced.
+    """
+
+    frames = numpy.asarray(frames, dtype=numpy.float32)
+    values = numpy.asarray(values, dtype=numpy.float32)
+    if len(frames) == 0:
+        return
+
+    # Keep only the last value given for each frame.
+    frames, last = numpy.unique(frames[::-1], return_index=True)
+    values = values[::-1][last]
+
+    fcurve = get_fcurve(obj, path)
+    if fcurve is None:
+        # Let Blender create an action, slot, and f-curve, new keyframe gets its value below.
+        obj.keyframe_insert(data_path=path, frame=float(frames[0]))
+        invalidate_fcurves(obj.animation_data.action)
+        fcurve = get_fcurve(obj, path)
+
+    keyframe_points = fcurve.keyframe_points
+    count = len(keyframe_points)
+    co = numpy.empty(count * 2, dtype=numpy.float32)
+    keyframe_points.foreach_get("co", co)
+    co = co.reshape(count, 2)
+
+    # Replace values of existing keyframes.
+    order = numpy.argsort(co[:, 0], kind='stable')
+    existing_frames = co[order, 0]
+    positions = numpy.searchsorted(existing_frames, frames)
+    exists = positions < count
+    exists[exists] = existing_frames[positions[exists]] == frames[exists]
+    co[order[positions[exists]], 1] = values[exists]
+
+    # Add new keyframes.
+    new_co = numpy.column_stack((frames[~exists], values[~exists]))
+    keyframe_points.add(len(new_co))
+    keyframe_points.foreach_set("co", numpy.concatenate((co, new_co)).ravel())
+
+    if constant:
+        _set_constant_interpolation(fcurve)
+
+    # Sort keyframes and recalculate handles.
+    fcurve.update()
+    invalidate_timing(obj.animation_data.action)
+
+
+def _set_constant_interpolation(fcurve):
+    # 'CONSTANT' is the first item in interpolation enum.
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.foreach_set("interpolation", numpy.zeros(len(keyframe_points), dtype=numpy.int32))
+
+
+# Keyframe properties that are copied when keyframes are rebuilt: (name, size, dtype).
+_keyframe_properties = (
+    ("co", 2, numpy.float32),
+    ("handle_left_type", 1, numpy.int32),
+    ("handle_right_type", 1, numpy.int32),
+    ("handle_left", 2, numpy.float32),
+    ("handle_right", 2, numpy.float32),
+    ("interpolation", 1, numpy.int32),
+    ("easing", 1, numpy.int32),
+    ("type", 1, numpy.int32),
+    ("back", 1, numpy.float32),
+    ("amplitude", 1, numpy.float32),
+    ("period", 1, numpy.float32),
+    ("select_control_point", 1, bool),
+    ("select_left_handle", 1, bool),
+    ("select_right_handle", 1, bool),
+)
+
+
+def remove_keyframes(obj, fcurve, value) -> int:
+    """
+    Removes all keyframes with the given value from the f-curve at once, and returns how many were removed.
+    Remaining keyframes are rebuilt with their handles, interpolation, and other properties preserved.
+    """
+
+    keyframe_points = fcurve.keyframe_points
+    count = len(keyframe_points)
+
+    co = numpy.empty(count * 2, dtype=numpy.float32)
+    keyframe_points.foreach_get("co", co)
+    keep = co[1::2] != value
+    keep_count = int(numpy.count_nonzero(keep))
+    if keep_count == count:
+        return 0
+
+    _rebuild_keyframes(obj, fcurve, _read_keyframes(keyframe_points, keep))
+
+    return count - keep_count
+
+
+def _read_keyframes(keyframe_points, mask) -> dict:
+    """Returns `dict` of keyframe property arrays (one row per keyframe) for the keyframes selected with `mask`."""
+
+    count = len(keyframe_points)
+    data = {}
+    for prop, size, dtype in _keyframe_properties:
+        array = numpy.empty(count * size, dtype=dtype)
+        keyframe_points.foreach_get(prop, array)
+        data[prop] = array.reshape(count, size)[mask]
+
+    return data
+
+
+def _rebuild_keyframes(obj, fcurve, data: dict):
+    """Replaces all keyframes of the f-curve with the ones in `data`, with all their properties."""
+
+    keyframe_points = fcurve.keyframe_points
+
+    if hasattr(keyframe_points, "clear"):
+        keyframe_points.clear()
+    else:
+        for keyframe in reversed(keyframe_points.values()):
+            keyframe_points.remove(keyframe, fast=True)
+
+    keyframe_points.add(len(data["co"]))
+    for prop, __, __ in _keyframe_properties:
+        keyframe_points.foreach_set(prop, data[prop].ravel())
+
+    fcurve.update()
+    invalidate_timing(obj.animation_data.action)
+
+
+def read_keyframes_in_range(fcurve, frame_start: float, frame_end: float) -> dict:
+    """Returns a snapshot of the f-curve keyframes in the frame range (inclusive), to be restored with `restore_keyframes_in_range`."""
+
+    keyframe_points = fcurve.keyframe_points
+    co = numpy.empty(len(keyframe_points) * 2, dtype=numpy.float32)
+    keyframe_points.foreach_get("co", co)
+    frames = co[0::2]
+
+    return _read_keyframes(keyframe_points, (frames >= frame_start) & (frames <= frame_end))
+
+
+def restore_keyframes_in_range(obj, fcurve, frame_start: float, frame_end: float, snapshot: dict):
+    """
+    Replaces keyframes of the f-curve in the frame range (inclusive) with the ones from the snapshot.
+    If `snapshot` is `None`, keyframes in the range are only removed.
+    """
+
+    keyframe_points = fcurve.keyframe_points
+    co = numpy.empty(len(keyframe_points) * 2, dtype=numpy.float32)
+    keyframe_points.foreach_get("co", co)
+    frames = co[0::2]
+
+    data = _read_keyframes(keyframe_points, (frames < frame_start) | (frames > frame_end))
+    if snapshot is not None:
+        data = {prop: numpy.concatenate((data[prop], snapshot[prop])) for prop in data}
+        order = numpy.argsort(data["co"][:, 0], kind='stable')
+        data = {prop: array[order] for prop, array in data.items()}
+
+    _rebuild_keyframes(obj, fcurve, data)
 
 
 def remove_fcurve(obj, fcurve):
@@ -66,14 +269,16 @@ def remove_fcurve(obj, fcurve):
     if fcurve is None:
         return
 
-    # Slotted actions check.
-    if bpy.app.version >= (5, 0, 0):
-        channelbag = ensure_channelbag(obj)
-        channelbag.fcurves.remove(fcurve)
-    else:
-        if not obj.animation_data or not obj.animation_data.action:
-            return
-        obj.animation_data.action.fcurves.remove(fcurve)
+    if not obj.animation_data or not obj.animation_data.action:
+        return
+
+    fcurves = _fcurves_collection(obj)
+    if fcurves is None:
+        return
+
+    fcurves.remove(fcurve)
+    invalidate_fcurves(obj.animation_data.action)
+    invalidate_timing(obj.animation_data.action)
 
 
 def delete_empty_action(obj):
@@ -85,11 +290,10 @@ def delete_empty_action(obj):
         # Slotted actions check.
         action = obj.animation_data.action
         slot = obj.animation_data.action_slot
-        channelbag = ensure_channelbag(obj)
-        fcurves = channelbag.fcurves
+        channelbag = find_channelbag(obj)
 
         # Remove action slot if there are no f-curves left in it.
-        if len(fcurves) == 0:
+        if channelbag is None or len(channelbag.fcurves) == 0:
             action.slots.remove(slot)
 
         # Remove action if there are no slots left in it.
@@ -128,17 +332,40 @@ def get_keymesh_fcurve(obj):
     return get_fcurve(obj, 'keymesh["Keymesh Data"]')
 
 
+def can_evaluate_directly(scene, obj) -> bool:
+    """
+    Checks if the Keymesh value of the object can be read directly from its Keymesh f-curve,
+    without evaluating the scene. That's not the case when the value is driven, animated
+    with NLA, blended with other actions, or when scene time is remapped.
+    """
+
+    anim_data = obj.animation_data
+    if anim_data is None or anim_data.action is None:
+        return False
+
+    if anim_data.use_tweak_mode:
+        return False
+    if anim_data.use_nla and len(anim_data.nla_tracks) > 0:
+        return False
+    if anim_data.action_blend_type != 'REPLACE' or anim_data.action_influence < 1.0:
+        return False
+
+    if scene.render.frame_map_old != scene.render.frame_map_new:
+        return False
+    if has_driver(obj, 'keymesh["Keymesh Data"]'):
+        return False
+
+    return True
+
+
 def get_keymesh_keyframes(obj) -> list:
-    """Returns a list of all Keymesh keyframes in the objects action & slot."""
+    """Returns a sorted list of all Keymesh keyframes in the objects action & slot."""
 
-    keyframes = []
-    fcurve = get_keymesh_fcurve(obj)
-    if fcurve:
-        keyframe_points = fcurve.keyframe_points
-        for kp in keyframe_points:
-            keyframes.append(int(kp.co[0]))
+    timing = get_keymesh_timing(obj)
+    if timing is None:
+        return []
 
-    return keyframes
+    return timing["frames"].astype(int).tolist()
 
 
 def insert_keymesh_keyframe(obj, frame, block_index=None):
@@ -156,6 +383,38 @@ def insert_keymesh_keyframe(obj, frame, block_index=None):
     insert_keyframe(obj, frame, 'keymesh["Keymesh Data"]', constant=True)
 
 
+def insert_keymesh_keyframes(obj, frames, block_indices):
+    """Inserts keyframes on a Keymesh data-path on all given frames at once, for given block indices."""
+
+    if len(frames) == 0:
+        return
+
+    # Set Animated Property
+    if obj.keymesh.animated == False:
+        obj.keymesh.animated = True
+
+    # Insert Keyframes
+    insert_keyframes(obj, frames, block_indices, 'keymesh["Keymesh Data"]', constant=True)
+
+
+def get_keymesh_block_usage(obj) -> dict:
+    """
+    Returns `dict` of Keymesh block indices and the number of times they're keyframed on the objects
+    Keymesh f-curve. Histogram is computed once and cached with the keyframes of the f-curve.
+    """
+
+    timing = get_keymesh_timing(obj)
+    if timing is None:
+        return {}
+
+    usage = timing.get("usage", None)
+    if usage is None:
+        values, counts = numpy.unique(timing["values"], return_counts=True)
+        usage = timing["usage"] = dict(zip(values.astype(int).tolist(), counts.tolist()))
+
+    return usage
+
+
 def keymesh_block_usage_count(obj, block) -> tuple[int, list]:
     """
     Returns:
@@ -164,16 +423,13 @@ def keymesh_block_usage_count(obj, block) -> tuple[int, list]:
             frames (list[int]): frames where the Keymesh value matches the block index.
     """
 
-    fcurve = get_keymesh_fcurve(obj)
-    value = block.keymesh["Data"]
+    block_index = block.keymesh["Data"]
+    count = get_keymesh_block_usage(obj).get(block_index, 0)
+    if count == 0:
+        return 0, []
 
-    count = 0
-    frames = []
-    if fcurve:
-        for keyframe in fcurve.keyframe_points:
-            if keyframe.co[1] == value:
-                count += 1
-                frames.append(int(keyframe.co[0]))
+    timing = get_keymesh_timing(obj)
+    frames = timing["frames"][timing["values"] == block_index].astype(int).tolist()
 
     return count, frames
 
@@ -210,3 +466,98 @@ def get_next_keymesh_block(context, obj, direction):
                     next_keymesh_block = mesh
 
     return next_keyframe, next_keymesh_block
+
+
+
+#### ------------------------------ /timing_engine/ ------------------------------ ####
+
+"""
+NOTE: Keyframes of Keymesh f-curves are copied into NumPy arrays (with `foreach_get`) and cached
+per action, action slot, and data-path, so that timeline doesn't have to be read one keyframe
+at a time. Cache is checked against the number of keyframes on every access, and dropped for
+the action whenever it's updated in depsgraph (i.e. keyframes are moved or edited).
+"""
+_timing_cache = {}
+
+
+def _timing_key(obj, path: str) -> tuple:
+    anim_data = obj.animation_data
+    slot = getattr(anim_data, "action_slot", None)
+
+    return (anim_data.action.session_uid, slot.handle if slot else 0, path)
+
+
+def get_fcurve_timing(obj, fcurve, path: str) -> dict:
+    """
+    Returns cached keyframe arrays of the f-curve.
+
+    Returns:
+        dict:
+            "count" (int): number of keyframes the arrays were built from.
+            "frames" (numpy.ndarray): frames of keyframes, sorted.
+            "values" (numpy.ndarray): values of keyframes, in the same order as frames.
+            "constant" (bool): whether f-curve can be evaluated by only looking up keyframes,
+                               i.e. all keyframes have constant interpolation and there are no modifiers.
+            "usage" (dict): added by `get_keymesh_block_usage` the first time it's needed.
+    """
+
+    key = _timing_key(obj, path)
+    keyframe_points = fcurve.keyframe_points
+    count = len(keyframe_points)
+
+    timing = _timing_cache.get(key, None)
+    if timing is None or timing["count"] != count:
+        co = numpy.empty(count * 2, dtype=numpy.float32)
+        keyframe_points.foreach_get("co", co)
+        co = co.reshape(count, 2)
+
+        # 'CONSTANT' is the first item in interpolation enum.
+        interpolation = numpy.empty(count, dtype=numpy.int32)
+        keyframe_points.foreach_get("interpolation", interpolation)
+
+        order = numpy.argsort(co[:, 0], kind='stable')
+        timing = {
+            "count": count,
+            "frames": co[order, 0],
+            "values": co[order, 1],
+            "constant": len(fcurve.modifiers) == 0 and bool(numpy.all(interpolation == 0)),
+        }
+        _timing_cache[key] = timing
+
+    return timing
+
+
+def get_keymesh_timing(obj, fcurve=None) -> dict:
+    """Returns cached keyframe arrays of objects Keymesh f-curve, or `None` if it's not animated."""
+
+    if fcurve is None:
+        fcurve = get_keymesh_fcurve(obj)
+    if fcurve is None:
+        return None
+
+    return get_fcurve_timing(obj, fcurve, 'keymesh["Keymesh Data"]')
+
+
+def keymesh_value_at_frame(obj, fcurve, frame: float) -> int:
+    """Returns the value of Keymesh f-curve on the given frame, without evaluating the scene."""
+
+    timing = get_keymesh_timing(obj, fcurve)
+    if timing["count"] == 0:
+        return None
+    if not timing["constant"]:
+        return int(fcurve.evaluate(frame))
+
+    # Constant interpolation holds the value of the last keyframe before the frame.
+    i = int(numpy.searchsorted(timing["frames"], frame, side='right')) - 1
+
+    return int(timing["values"][max(i, 0)])
+
+
+def invalidate_timing(action=None):
+    """Drops cached keyframe arrays for the given action, or for all actions if `action` is `None`."""
+
+    if action is None:
+        _timing_cache.clear()
+    else:
+        for key in [key for key in _timing_cache if key[0] == action.session_uid]:
+            del _timing_cache[key]
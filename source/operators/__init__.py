@@ -8,6 +8,7 @@ if "bpy" in locals():
                 insert_keyframe,
                 # interpolate,
                 join_extract,
+                profiler,
                 purge,
                 timeline_jump,
                 ]:
@@ -23,6 +24,7 @@ else:
         insert_keyframe,
         # interpolate,
         join_extract,
+        profiler,
         purge,
         timeline_jump,
     )
@@ -39,6 +41,7 @@ modules = [
     insert_keyframe,
     # interpolate,
     join_extract,
+    profiler,
     purge,
     timeline_jump,
 ]
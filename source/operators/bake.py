@@ -1,15 +1,24 @@
 import bpy
+import hashlib
+import json
 import numpy
+import os
+import shutil
+import subprocess
+import tempfile
 import time
 from contextlib import contextmanager
 
 from ..functions.handler import (
     update_keymesh,
+    update_keymesh_pre,
 )
 from ..functions.object import (
     get_next_keymesh_index,
     assign_keymesh_id,
     insert_block,
+    remove_block,
+    remove_keymesh_properties,
     duplicate_object,
     convert_to_mesh,
     store_modifiers,
@@ -23,8 +32,11 @@ from ..functions.thumbnail import (
     _make_enum_item,
 )
 from ..functions.timeline import (
-    insert_keyframe,
-    insert_keymesh_keyframe,
+    get_keymesh_fcurve,
+    insert_keyframes,
+    insert_keymesh_keyframes,
+    read_keyframes_in_range,
+    restore_keyframes_in_range,
 )
 
 
@@ -32,6 +44,28 @@ apply_types = ['MESH', 'LATTICE']
 convert_types = ['CURVE', 'SURFACE', 'FONT']
 shape_key_types = ['MESH', 'CURVE', 'SURFACE', 'LATTICE']
 
+# Line that `bake_worker.py` prints for every frame it bakes.
+bake_worker_marker = "Keymesh: baked frame"
+
+# Bake checkpoint keys, and how often (in seconds) baked blocks are written into checkpoint files.
+checkpoint_settings = ("bake_type", "modifiers", "modifier_handling", "keep_original",
+                       "instance_duplicates", "duplicate_threshold", "reuse_topology")
+checkpoint_keys = ("start", "end", "step", "frame", "data", "backup") + checkpoint_settings
+checkpoint_interval = 10.0
+
+# `bpy.data` collections of data-blocks that can be written into checkpoint files (by `id_type`).
+checkpoint_collections = {
+    'MESH': "meshes",
+    'CURVE': "curves",
+    'CURVES': "hair_curves",
+    'METABALL': "metaballs",
+    'LATTICE': "lattices",
+    'LIGHT': "lights",
+    'LIGHT_PROBE': "lightprobes",
+    'CAMERA': "cameras",
+    'SPEAKER': "speakers",
+}
+
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
 def get_modifier_enum_items(self, context):
@@ -49,6 +83,162 @@ def get_modifier_enum_items(self, context):
     return enum_items
 
 
+def get_checkpoint_dir(obj) -> str:
+    """Returns the directory where checkpoint files of the objects bake are saved, or `None` if .blend file isn't saved."""
+
+    if not bpy.data.filepath:
+        return None
+
+    """
+    NOTE: Cleaned names of different objects can be the same (e.g. "Cube.001" and "Cube_001"),
+    so hash of the full name is added to the directory name to keep it unique.
+    """
+    name_hash = hashlib.blake2b(obj.name.encode("utf-8"), digest_size=4).hexdigest()
+    return os.path.join(os.path.splitext(bpy.data.filepath)[0] + "_keymesh_bake",
+                        bpy.path.clean_name(obj.name) + "_" + name_hash)
+
+
+def owns_checkpoint_dir(directory, obj) -> bool:
+    """Checks that the checkpoint directory can be removed for the object, i.e. it's empty or its checkpoint belongs to the object."""
+
+    path = os.path.join(directory, "checkpoint.json")
+    if not os.path.isdir(directory) or not os.path.isfile(path):
+        return True
+
+    try:
+        with open(path, 'r') as file:
+            return json.load(file).get("object", None) == obj.name
+    except (OSError, ValueError):
+        return False
+
+
+def read_checkpoint_file(obj) -> dict:
+    """
+    Returns the checkpoint file of the objects interrupted bake, or `None` if there isn't one.
+    Chunks are only read up to the first one whose .blend file is missing.
+    """
+
+    directory = get_checkpoint_dir(obj)
+    if directory is None:
+        return None
+
+    path = os.path.join(directory, "checkpoint.json")
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, 'r') as file:
+            checkpoint_file = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if checkpoint_file.get("object", None) != obj.name or any(key not in checkpoint_file for key in checkpoint_keys):
+        return None
+
+    chunks = []
+    for chunk in checkpoint_file.get("chunks", []):
+        if chunk["file"] and not os.path.isfile(os.path.join(directory, chunk["file"])):
+            break
+        chunks.append(chunk)
+    if not chunks:
+        return None
+
+    checkpoint_file["chunks"] = chunks
+    checkpoint_file["frame"] = chunks[-1]["frame"]
+    return checkpoint_file
+
+
+def remove_checkpoint_dir(directory, obj):
+    """
+    Removes checkpoint files of the objects bake, and the parent directory if there are no other checkpoints in it.
+    Directory is left alone if it holds the checkpoint of a different object.
+    """
+
+    if not owns_checkpoint_dir(directory, obj):
+        return
+
+    shutil.rmtree(directory, ignore_errors=True)
+    try:
+        os.rmdir(os.path.dirname(directory))
+    except OSError:
+        pass
+
+
+def _write_json(path, data):
+    """Writes the file in one step, so that it's never left half-written when Blender crashes."""
+
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+def _is_cache_baked(point_cache) -> bool:
+    """Checks if point cache is baked where background processes can read it (i.e. stored in the .blend file)."""
+
+    return point_cache.is_baked and (not point_cache.use_disk_cache or point_cache.use_external)
+
+
+def _has_simulation_zone(node_tree, visited=None) -> bool:
+    """Checks if Geometry Nodes node tree, or any of the node groups inside of it, has a simulation zone."""
+
+    if visited is None:
+        visited = set()
+    visited.add(node_tree)
+
+    for node in node_tree.nodes:
+        if node.bl_idname == 'GeometryNodeSimulationOutput':
+            return True
+        if node.type == 'GROUP' and node.node_tree is not None and node.node_tree not in visited:
+            if _has_simulation_zone(node.node_tree, visited):
+                return True
+
+    return False
+
+
+def find_unbaked_simulations(scene, obj) -> list:
+    """
+    Returns names of simulations on the object (and in the scene) that can't be continued from the middle of
+    the frame range, either because they aren't baked, or their bakes can't be read from the copy of the file.
+    """
+
+    simulations = []
+    for mod in obj.modifiers:
+        caches = []
+        if mod.type == 'PARTICLE_SYSTEM':
+            particle_system = mod.particle_system
+            if particle_system.settings.type == 'EMITTER' or particle_system.use_hair_dynamics:
+                caches.append(particle_system.point_cache)
+
+        elif mod.type == 'DYNAMIC_PAINT':
+            if mod.canvas_settings is not None:
+                caches.extend(surface.point_cache for surface in mod.canvas_settings.canvas_surfaces)
+
+        elif mod.type == 'FLUID':
+            """NOTE: Fluid caches are always stored on disk, relative to the original file."""
+            if mod.fluid_type == 'DOMAIN':
+                simulations.append(mod.name)
+                continue
+
+        elif mod.type == 'NODES':
+            if mod.node_group is not None and _has_simulation_zone(mod.node_group):
+                simulations.append(mod.name)
+                continue
+
+        elif getattr(mod, "point_cache", None) is not None:
+            caches.append(mod.point_cache)
+
+        if any(not _is_cache_baked(cache) for cache in caches):
+            simulations.append(mod.name)
+
+    # Rigid bodies can move objects that modifiers depend on.
+    rigidbody_world = scene.rigidbody_world
+    if rigidbody_world is not None and rigidbody_world.enabled and not _is_cache_baked(rigidbody_world.point_cache):
+        simulations.append("Rigid Body World")
+
+    return simulations
+
+
 
 #### ------------------------------ OPERATORS ------------------------------ ####
 
@@ -125,8 +315,70 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
     instance_duplicates: bpy.props.BoolProperty(
         name = "Instance Duplicates",
         description = ("Operator will detect if some blocks are exactly the same (same shape key values, same keyframes, etc).\n"
-                       "If they are, it will reuse same Keymesh block on those frames, instead of creating new one for each.\n"
-                       "WARNING: For complex objects this is expensive calculation and might make operator slower"),
+                       "If they are, it will reuse same Keymesh block on those frames, instead of creating new one for each"),
+        default = False,
+    )
+    processes: bpy.props.IntProperty(
+        name = "Processes",
+        description = ("Number of background Blender processes that frame range is split between and baked in parallel.\n"
+                       "Only used for meshes when baking modifiers. Each process opens a copy of the .blend file,\n"
+                       "so objects with simulations (including Geometry Nodes simulations) are baked in a single process"),
+        min = 1, soft_max = os.cpu_count() or 1,
+        default = 1,
+    )
+    process_timeout: bpy.props.IntProperty(
+        name = "Timeout",
+        description = ("Cancel parallel baking if none of the processes bake a frame for this many seconds.\n"
+                       "When baking from the interface, parallel baking can also be cancelled with Esc"),
+        min = 1, soft_max = 3600,
+        default = 600,
+    )
+    reuse_topology: bpy.props.BoolProperty(
+        name = "Reuse Topology",
+        description = ("Faster baking for meshes whose topology doesn't change over the frame range (e.g. armature deformations).\n"
+                       "Only vertex positions are baked, every block is a copy of the previous one with new positions.\n"
+                       "Frames where topology changes, or meshes with custom normals, are converted fully.\n"
+                       "WARNING: Other attributes animated by modifiers (UVs, colors, etc.) won't be baked"),
+        default = False,
+    )
+    duplicate_threshold: bpy.props.FloatProperty(
+        name = "Tolerance",
+        description = ("Maximum distance any vertex can move for frames to still be considered duplicates.\n"
+                       "Merges frames that only differ by floating point noise, e.g. from simulations or armatures.\n"
+                       "With zero only exact duplicates are instanced"),
+        subtype = 'DISTANCE',
+        min = 0.0, soft_max = 0.01,
+        step = 0.001, precision = 5,
+        default = 0.0,
+    )
+
+    # Interactive Bake
+    interactive: bpy.props.BoolProperty(
+        name = "Interactive",
+        description = ("Bake frames in chunks while showing progress, so that long bakes can be cancelled with Esc.\n"
+                       "Bake can be paused on cancel and resumed later"),
+        default = False,
+    )
+    save_checkpoints: bpy.props.BoolProperty(
+        name = "Save Checkpoints",
+        description = ("Periodically save baked frames into a '<file name>_keymesh_bake' directory next to the .blend file,\n"
+                       "so that bake can be resumed after Blender is closed or crashes.\n"
+                       "Only works if .blend file is saved. Directory is removed when the bake is finished or discarded"),
+        default = False,
+    )
+    cancel_action: bpy.props.EnumProperty(
+        name = "On Cancel",
+        description = "What to do with frames that were already baked when interactive bake is cancelled",
+        items = (('KEEP', "Keep Baked Frames", "Bake is finished early, frames baked before cancelling are kept as Keymesh blocks"),
+                 ('PAUSE', "Pause", ("Frames baked before cancelling are kept, but the bake is left unfinished so that it can be resumed.\n"
+                                     "Keymesh animation and modifiers are left untouched until the bake is finished")),
+                 ('ROLLBACK', "Discard Baked Frames", "Everything created by the bake is removed and object is restored")),
+        default = 'KEEP',
+    )
+    resume: bpy.props.BoolProperty(
+        name = "Resume Interrupted Bake",
+        description = ("Active object has a bake that was paused, or interrupted by Blender closing, before it finished.\n"
+                       "Continue baking it from the frame after the last saved one, with its frame range and bake settings"),
         default = False,
     )
 
@@ -160,15 +412,23 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
         layout.use_property_split = True
         layout.use_property_decorate = False
 
+        # Resume
+        checkpoint_dir = get_checkpoint_dir(obj)
+        if obj.keymesh.get("Bake Checkpoint", None) is not None or \
+            (checkpoint_dir is not None and os.path.isfile(os.path.join(checkpoint_dir, "checkpoint.json"))):
+            layout.prop(self, "resume")
+            layout.separator()
+
         # Frame Range
         layout.prop(self, "follow_scene_range")
         col = layout.column(align=True)
         col.prop(self, "frame_start", text="Frame Start")
         col.prop(self, "frame_end", text="End")
-        if self.follow_scene_range:
+        if self.follow_scene_range or self.resume:
             col.enabled = False
         col = layout.column(align=True)
         col.prop(self, "frame_step", text="Step")
+        col.enabled = not self.resume
         col.separator()
 
         # General
@@ -177,21 +437,34 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
         if ((obj.type in apply_types) or
             (obj.type not in apply_types and (self.bake_type in ('SHAPE_KEYS', 'NOTHING') or
                                               self.bake_type == 'ALL' and self.has_modifiers == False))):
-            layout.prop(self, "keep_original")
+            row = layout.row()
+            row.prop(self, "keep_original")
+            row.enabled = not self.resume
 
         # Bake Type
         header, panel = layout.panel("ANIM_OT_bake_to_keymesh_data", default_closed=False)
         header.label(text="Bake Data")
 
         if panel:
-            panel.prop(self, "bake_type")
+            """NOTE: When resuming, settings are taken from the checkpoint."""
+            row = panel.row()
+            row.prop(self, "bake_type")
+            row.enabled = not self.resume
 
             # all
             if self.bake_type == 'ALL':
                 if self.has_modifiers:
                     if obj.type in apply_types:
-                        panel.prop(self, "modifier_handling")
-                        panel.prop(self, "modifiers", expand=True)
+                        col = panel.column()
+                        col.prop(self, "modifier_handling")
+                        col.prop(self, "modifiers", expand=True)
+                        if obj.type == 'MESH':
+                            col.prop(self, "reuse_topology")
+                        col.enabled = not self.resume
+                        if obj.type == 'MESH':
+                            panel.prop(self, "processes")
+                            if self.processes > 1:
+                                panel.prop(self, "process_timeout")
 
                     else:
                         row = panel.row()
@@ -213,7 +486,23 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
                         row.label(text=f"{obj.type} doesn't support shape keys", icon='INFO')
 
             if obj.type == 'MESH' and self.bake_type != 'NOTHING':
-                panel.prop(self, "instance_duplicates")
+                col = panel.column()
+                col.prop(self, "instance_duplicates")
+                if self.bake_type == 'ALL':
+                    row = col.row()
+                    row.prop(self, "duplicate_threshold")
+                    row.enabled = self.instance_duplicates
+                col.enabled = not self.resume
+
+        # Interactive
+        layout.separator()
+        layout.prop(self, "interactive")
+        row = layout.row()
+        row.prop(self, "cancel_action")
+        row.enabled = self.interactive
+        row = layout.row()
+        row.prop(self, "save_checkpoints")
+        row.enabled = bool(bpy.data.filepath)
 
 
     def invoke(self, context, event):
@@ -222,6 +511,15 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
         self.frame_start = context.scene.frame_start
         self.frame_end = context.scene.frame_end
 
+        # Offer to resume interrupted bake.
+        checkpoint = obj.keymesh.get("Bake Checkpoint", None)
+        if checkpoint is None:
+            checkpoint = read_checkpoint_file(obj)
+        self.resume = checkpoint is not None
+        data = obj.data
+        if checkpoint is not None:
+            data = obj_data_type(obj).get(checkpoint["data"], obj.data)
+
         # modifiers_poll
         self.has_modifiers = False
         if len(obj.modifiers) > 0:
@@ -230,7 +528,7 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
         # shape_key_poll
         self.has_shape_keys = False
         if obj.type in shape_key_types:
-            if obj.data.shape_keys:
+            if data.shape_keys:
                 self.has_shape_keys = True
 
 
@@ -262,107 +560,579 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
 
 
     def execute(self, context):
-        start_time = time.time()
-        bpy.app.handlers.frame_change_post.remove(update_keymesh)
+        if not self._bake_setup(context):
+            return {'CANCELLED'}
+
+        # Interactive Bake
+        """NOTE: Parallel bakes started from the interface are always modal, so that waiting for processes can be cancelled."""
+        if self.interactive or self._workers is not None:
+            wm = context.window_manager
+            self._timer = wm.event_timer_add(0.01, window=context.window)
+            wm.progress_begin(0, len(self._frames))
+            wm.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
+
+        for frame in self._frames:
+            self._bake_frame(context, frame)
+            self._frame_index += 1
+            if self.save_checkpoints and time.time() - self._last_file_write > checkpoint_interval:
+                self._save_checkpoint(write_file=True)
+
+        self._bake_finish(context)
+        return {'FINISHED'}
+
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._stop_modal(context)
+            nothing_baked = self._frame_index == 0 and self._checkpoint is None
+            if self.cancel_action == 'KEEP' and not nothing_baked:
+                self._bake_finish(context)
+                self.report({'INFO'}, "Bake cancelled, " + str(self._frame_index) + " baked frame(s) were kept")
+                return {'FINISHED'}
+            elif self.cancel_action == 'PAUSE' and not nothing_baked:
+                self._bake_pause(context)
+                self.report({'INFO'}, "Bake paused, run Bake to Keymesh again to resume it")
+                return {'FINISHED'}
+            else:
+                self._bake_rollback(context)
+                self.report({'INFO'}, "Bake cancelled, baked frames were discarded")
+                return {'CANCELLED'}
+
+        # Block the interface while baking, so that baked data isn't changed.
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        # Wait for Parallel Processes
+        if self._workers is not None:
+            status, baked_count = self._poll_processes()
+            context.window_manager.progress_update(baked_count)
+            context.workspace.status_text_set("Baking to Keymesh in " + str(len(self._workers["processes"])) + " processes: " +
+                                              str(baked_count) + "/" + str(len(self._frames)) + " frames (Esc to cancel)")
+            if status == 'RUNNING':
+                return {'RUNNING_MODAL'}
+
+            if status == 'FINISHED':
+                self._parallel_blocks = self._collect_processes()
+            self._stop_processes()
+
+            if self._parallel_blocks is None:
+                self._stop_modal(context)
+                self._bake_rollback(context)
+                return {'CANCELLED'}
+
+            return {'RUNNING_MODAL'}
+
+        # Bake frames in chunks, so that interface can be redrawn between them.
+        chunk_start = time.time()
+        while self._frame_index < len(self._frames):
+            self._bake_frame(context, self._frames[self._frame_index])
+            self._frame_index += 1
+            if time.time() - chunk_start > 0.25:
+                break
+
+        self._save_checkpoint(write_file=time.time() - self._last_file_write > checkpoint_interval)
+        context.window_manager.progress_update(self._frame_index)
+        context.workspace.status_text_set("Baking to Keymesh: " + str(self._frame_index) + "/" +
+                                          str(len(self._frames)) + " frames (Esc to cancel)")
+
+        if self._frame_index < len(self._frames):
+            return {'RUNNING_MODAL'}
+
+        self._stop_modal(context)
+        self._bake_finish(context)
+        return {'FINISHED'}
+
+
+    # /bake_steps/
+    def _bake_setup(self, context) -> bool:
+        """Prepares the object and the state of the bake. Returns `False` if bake can't be started."""
+
+        self._start_time = time.time()
 
         obj = context.active_object
-        original_type = obj.type
-        original_data = obj.data
+        self._obj = obj
+        self._original_type = obj.type
+        self._original_data = obj.data
+        self._initial_frame = context.scene.frame_current
+
+        # Find Checkpoints
+        checkpoint = obj.keymesh.get("Bake Checkpoint", None)
+        checkpoint = checkpoint.to_dict() if checkpoint is not None else None
+        self._checkpoint_dir = get_checkpoint_dir(obj)
+        checkpoint_file = read_checkpoint_file(obj)
+        if checkpoint is not None and checkpoint_file is not None and checkpoint_file["data"] != checkpoint["data"]:
+            # Checkpoint file belongs to a different bake.
+            checkpoint_file = None
+
+        """
+        NOTE: Checkpoint stored on the object is only saved with the .blend file, so checkpoint file can be ahead of it
+        if Blender was closed or crashed during the bake. Only the chunks that were baked after that are loaded from it.
+        """
+        self._checkpoint = None
+        self._checkpoint_file = None
+        checkpoint_chunks = []
+        if self.resume:
+            self._checkpoint = checkpoint
+            self._checkpoint_file = checkpoint_file
+            if checkpoint_file is not None:
+                checkpoint_chunks = [chunk for chunk in checkpoint_file["chunks"]
+                                     if checkpoint is None or chunk["frame"] > checkpoint["frame"]]
+                if checkpoint_chunks:
+                    self._checkpoint = {key: checkpoint_file[key] for key in checkpoint_keys}
+        self._initial_checkpoint_file = json.loads(json.dumps(self._checkpoint_file))
 
         # Define Frame Range
-        initial_frame = context.scene.frame_current
-        if self.follow_scene_range == True:
+        if self._checkpoint is not None:
+            self.frame_start = self._checkpoint["start"]
+            self.frame_end = self._checkpoint["end"]
+            self.frame_step = self._checkpoint["step"]
+            if not self._restore_checkpoint_settings(obj):
+                self.report({'ERROR'}, "Settings or modifiers that interrupted bake started with were not found, bake can't be resumed")
+                return False
+        elif self.follow_scene_range == True:
             self.frame_start = context.scene.frame_start
             self.frame_end = context.scene.frame_end
 
         if self.frame_start > self.frame_end:
             self.report({'ERROR'}, "Start frame can't be higher than the end frame")
-            return {'CANCELLED'}
+            return False
+
+        self._frames = list(range(self.frame_start, self.frame_end + 1, self.frame_step))
+        self._frame_index = 0
+
+        # Resume Interrupted Bake
+        self._backup_obj = None
+        if self._checkpoint is not None:
+            original_data = obj_data_type(obj).get(self._checkpoint["data"], None)
+            if original_data is None:
+                self.report({'ERROR'}, "Object data that interrupted bake started from was not found, bake can't be resumed")
+                return False
+
+            """NOTE: Frame handler might've changed objects data when the file was re-opened."""
+            obj.data = original_data
+            self._original_data = original_data
+            self._backup_obj = bpy.data.objects.get(self._checkpoint["backup"], None)
 
         # Define Modifier Selection
-        selected_modifiers = ",".join(self.modifiers)
-        if selected_modifiers != "" and (obj.modifiers[0].name not in selected_modifiers):
+        """NOTE: Modifiers are listed in stack order, so that the same selection is always stored the same way in checkpoints."""
+        self._selected_modifiers = ",".join(mod.name for mod in obj.modifiers if mod.name in self.modifiers)
+        if self._selected_modifiers != "" and (obj.modifiers[0].name not in self._selected_modifiers):
             self.report({'WARNING'}, "Baked modifier(s) were not first in the stack, result may be unexpected")
 
+        bpy.app.handlers.frame_change_pre.remove(update_keymesh_pre)
+        bpy.app.handlers.frame_change_post.remove(update_keymesh)
+
         # Back-up Original Object
-        if self.back_up or original_type == 'LATTICE':
+        """NOTE: Back-up of the bake that was interrupted by a crash isn't in the file, so it's created again."""
+        self._created_backup = False
+        if self._backup_obj is None and (self.back_up or self._original_type == 'LATTICE'):
             """
             NOTE: Duplicate has to be created for Lattice,
             because storing modifiers of original object is bugged.
             """
-            backup_obj = duplicate_object(context, obj, original_data, name=obj.name + "_backup", collection=True)
-            backup_obj.hide_render = True
-            backup_obj.hide_viewport = True
+            self._backup_obj = duplicate_object(context, obj, self._original_data, name=obj.name + "_backup", collection=True)
+            self._backup_obj.hide_render = True
+            self._backup_obj.hide_viewport = True
+            self._created_backup = True
 
         # Assign Keymesh ID
+        self._was_keymesh = obj.keymesh.active
         assign_keymesh_id(obj, animate=True)
 
+        self._unique_shape_keys = {}
+        self._unique_verts = {}
+        self._verts_buffer = None
+        self._template = None
+        self._quantized_buffer = None
+        self._last_unique = None
+        self._merged_count = 0
+        self._garbage_shape_keys = []
+        self._duplicate_blocks = []
+        self._created_blocks = []
+        self._keyframes = {}
+        self._baked_keyframes = {}
+        self._last_block_index = None
+        self._parallel_blocks = None
+        self._workers = None
+
+        # Checkpoint File State
+        self._file_block_count = 0
+        self._file_frame_index = 0
+        self._last_file_write = time.time()
+
+        # Load blocks baked before Blender was closed.
+        if checkpoint_chunks:
+            self._checkpoint["frame"] = checkpoint["frame"] if checkpoint is not None else self.frame_start - 1
+            self._load_checkpoint_chunks(checkpoint_chunks)
+            if self._backup_obj is not None:
+                self._checkpoint["backup"] = self._backup_obj.name
+
+        if self._checkpoint is not None:
+            self._frames = [frame for frame in self._frames if frame > self._checkpoint["frame"]]
+
+        # Store keyframes that bake will overwrite, so that they can be restored if it's cancelled.
+        fcurve = get_keymesh_fcurve(obj)
+        self._keyframes_range = (self.frame_start - 1, self.frame_end + 1)
+        self._keyframes_snapshot = read_keyframes_in_range(fcurve, *self._keyframes_range) if fcurve else None
+
+        # Blocks baked before the bake was interrupted can be instanced too.
+        if self._checkpoint is not None and self.instance_duplicates and \
+            self._original_type == 'MESH' and self.bake_type == 'ALL':
+            for block in obj.keymesh.blocks:
+                if block.block is None or block.block == self._original_data:
+                    continue
+                verts, match = self._match_vertices(block.block.vertices, self._unique_verts)
+                if match is None:
+                    digest, verts_co = verts
+                    self._unique_verts.setdefault(digest, []).append((block.block, verts_co.copy()))
+
+        # Bake in Parallel
+        """NOTE: When there is a window, processes are waited for in `modal`, so that it can be cancelled with Esc."""
+        if self._can_bake_in_parallel(context, obj, self._frames):
+            # If processes can't be started, frames are baked in this process.
+            if self._start_processes(context, obj, self._selected_modifiers, self._frames):
+                if not (self.interactive or context.window is not None):
+                    self._parallel_blocks = self._wait_for_processes(context)
+                    if self._parallel_blocks is None:
+                        self._bake_rollback(context)
+                        return False
+
+        return True
 
-        unique_shape_keys_dict = {}
-        unique_verts_dict = {}
-        garbage_shape_keys = []
-        for frame in range(self.frame_start, self.frame_end + 1, self.frame_step):
-            context.scene.frame_set(frame)
 
-            # Detect Duplicate
-            match = None
-            if self.instance_duplicates and original_type == 'MESH':
-                verts_co, sk_values, match = self._detect_duplicate(context, obj, original_data,
-                                                                    unique_verts_dict, unique_shape_keys_dict)
+    def _bake_frame(self, context, frame: int):
+        """Bakes the object on the given frame into a new Keymesh block, or reuses the duplicate one."""
 
-            if match:
-                block_index = match.keymesh.get("Data", None)
+        obj = self._obj
+        original_type = self._original_type
+        original_data = self._original_data
+        selected_modifiers = self._selected_modifiers
+        parallel_blocks = self._parallel_blocks
+
+        if parallel_blocks is None:
+            context.scene.frame_set(frame)
+
+        # Detect Duplicate
+        match = None
+        verts = None
+        sk_values = None
+        if self.instance_duplicates and original_type == 'MESH':
+            if parallel_blocks is not None:
+                verts, match = self._match_vertices(parallel_blocks[frame].vertices, self._unique_verts)
             else:
-                # Apply Modifiers
-                if self.bake_type == 'ALL' and self.has_modifiers:
+                verts, sk_values, match = self._detect_duplicate(context, obj, original_data,
+                                                                 self._unique_verts, self._unique_shape_keys)
+
+        if match:
+            block_index = match.keymesh.get("Data", None)
+            self._merged_count += 1
+            if parallel_blocks is not None:
+                self._duplicate_blocks.append(parallel_blocks[frame])
+        else:
+            # Apply Modifiers
+            if self.bake_type == 'ALL' and self.has_modifiers:
+
+                """Main, the fastest method of applying modifiers by creating new mesh from evaluated object."""
+                if parallel_blocks is not None:
+                    new_block = parallel_blocks[frame]
+
+                elif original_type == 'MESH' or original_type in convert_types:
+                    with self._disable_unselected_modifiers(obj, selected_modifiers):
+                        new_block = None
+                        if self.reuse_topology and original_type == 'MESH':
+                            new_block = self._copy_template(context, obj)
 
-                    """Main, the fastest method of applying modifiers by creating new mesh from evaluated object."""
-                    if original_type == 'MESH' or original_type in convert_types:
-                        with self._disable_unselected_modifiers(obj, selected_modifiers):
+                        if new_block is None:
                             new_block = convert_to_mesh(context, obj)
+                            if self.reuse_topology and original_type == 'MESH':
+                                self._set_template(new_block)
 
-                    """Lattices can't be converted to Mesh, so they need a special handling and applying modifiers via `bpy.ops`."""
-                    if original_type == 'LATTICE':
-                        new_block = self._apply_selected_modifiers(obj, selected_modifiers,
-                                                                   backup_obj, garbage_shape_keys)
+                """Lattices can't be converted to Mesh, so they need a special handling and applying modifiers via `bpy.ops`."""
+                if original_type == 'LATTICE':
+                    new_block = self._apply_selected_modifiers(obj, selected_modifiers,
+                                                               self._backup_obj, self._garbage_shape_keys)
 
-                    """Curves object type can't be converted to Mesh yet with `new_from_object`, so `bpy.ops` workaround is needed."""
-                    if original_type == 'CURVES':
-                        new_block = self._curves_to_mesh(context, obj, garbage_shape_keys)
+                """Curves object type can't be converted to Mesh yet with `new_from_object`, so `bpy.ops` workaround is needed."""
+                if original_type == 'CURVES':
+                    new_block = self._curves_to_mesh(context, obj, self._garbage_shape_keys)
 
-                    if self.instance_duplicates:
-                        unique_verts_dict[new_block] = verts_co
+                if self.instance_duplicates and verts is not None:
+                    digest, verts_co = verts
+                    self._last_unique = (new_block, verts_co.copy())
+                    self._unique_verts.setdefault(digest, []).append(self._last_unique)
 
 
-                # Apply Shape Keys
-                elif self.has_shape_keys and \
-                    ((self.bake_type == 'SHAPE_KEYS') or \
-                     (self.bake_type == 'ALL' and self.has_modifiers == False)):
-                    new_block = original_data.copy()
-                    garbage_shape_keys.append(new_block.shape_keys.name)
+            # Apply Shape Keys
+            elif self.has_shape_keys and \
+                ((self.bake_type == 'SHAPE_KEYS') or \
+                 (self.bake_type == 'ALL' and self.has_modifiers == False)):
+                new_block = original_data.copy()
+                self._garbage_shape_keys.append(new_block.shape_keys.name)
 
-                    obj.data = new_block
-                    bpy.ops.object.shape_key_remove(all=True, apply_mix=True)
-                    obj.data = original_data
+                obj.data = new_block
+                bpy.ops.object.shape_key_remove(all=True, apply_mix=True)
+                obj.data = original_data
 
-                    if self.instance_duplicates:
-                        unique_shape_keys_dict[sk_values] = new_block
+                if self.instance_duplicates:
+                    self._unique_shape_keys[sk_values] = new_block
 
 
-                # Apply Nothing
-                else:
-                    new_block = original_data.copy()
+            # Apply Nothing
+            else:
+                new_block = original_data.copy()
+
+
+            # Assign new block to the object.
+            new_block.name = obj.name + "_frame_" + str(frame)
+            block_index = get_next_keymesh_index(obj)
+            insert_block(obj, new_block, block_index)
+            self._created_blocks.append(new_block)
+
+
+        # Store Keyframe
+        self._keyframes[frame] = block_index
+        self._baked_keyframes[frame] = block_index
+        self._last_block_index = block_index
+
+
+    def _insert_stored_keyframes(self):
+        """
+        NOTE: Keyframes are inserted all at once after the bake (or after each chunk of the interactive bake),
+        because inserting them one by one re-sorts the f-curve and recalculates its handles after every frame.
+        """
+
+        insert_keymesh_keyframes(self._obj, list(self._keyframes.keys()), list(self._keyframes.values()))
+        self._keyframes.clear()
+
+
+    def _checkpoint_values(self) -> dict:
+        """Returns the checkpoint of the bake, i.e. its settings and the last baked frame, or `None` if nothing was baked."""
+
+        if self._frame_index > 0:
+            frame = self._frames[self._frame_index - 1]
+        elif self._checkpoint is not None:
+            frame = self._checkpoint["frame"]
+        else:
+            return None
+
+        return {
+            "start": self.frame_start,
+            "end": self.frame_end,
+            "step": self.frame_step,
+            "frame": frame,
+            "data": self._original_data.name,
+            "backup": self._backup_obj.name if self._backup_obj else "",
+            "bake_type": self.bake_type,
+            "modifiers": self._selected_modifiers,
+            "modifier_handling": self.modifier_handling,
+            "keep_original": self.keep_original,
+            "instance_duplicates": self.instance_duplicates,
+            "duplicate_threshold": self.duplicate_threshold,
+            "reuse_topology": self.reuse_topology,
+        }
+
+
+    def _restore_checkpoint_settings(self, obj) -> bool:
+        """
+        Sets bake settings to the ones stored in the checkpoint, because frames that were already baked used them.
+        Returns `False` if settings are missing, or modifiers that were baked can't be selected anymore (i.e. they were removed or renamed).
+        """
+
+        if any(key not in self._checkpoint for key in checkpoint_settings):
+            return False
+
+        for key in checkpoint_settings:
+            if key == "modifiers":
+                continue
+            setattr(self, key, self._checkpoint[key])
+
+        modifiers = self._checkpoint["modifiers"]
+        modifiers = modifiers.split(",") if modifiers else []
+        if any(name not in obj.modifiers for name in modifiers):
+            return False
+        self.modifiers = set(modifiers)
+
+        return True
+
+
+    def _save_checkpoint(self, write_file=False):
+        """
+        Inserts keyframes of baked frames and stores the last baked frame on the object, so that interrupted bake can be resumed.
+        If `write_file` is True, blocks baked since the last checkpoint file was written are also saved to the disk.
+        """
+
+        checkpoint = self._checkpoint_values()
+        if checkpoint is None:
+            return
+
+        self._insert_stored_keyframes()
+        self._obj.keymesh["Bake Checkpoint"] = checkpoint
+
+        if write_file:
+            self._write_checkpoint_file(checkpoint)
+
+
+    def _write_checkpoint_file(self, checkpoint):
+        """
+        Writes blocks baked since the last checkpoint file into a new chunk .blend file, and adds it to the checkpoint file.
+        NOTE: Checkpoint stored on the object only reaches the disk when .blend file is saved, which Blender doesn't do
+        (not even autosave) while operator is running, so bake that is interrupted by a crash is resumed from these files.
+        """
+
+        directory = self._checkpoint_dir
+        if directory is None or not self.save_checkpoints or self._frame_index == self._file_frame_index:
+            return
+
+        try:
+            # New bake replaces the checkpoint of the previous one.
+            if self._checkpoint_file is None:
+                if not owns_checkpoint_dir(directory, self._obj):
+                    raise OSError("directory " + directory + " holds a checkpoint of a different object")
+                shutil.rmtree(directory, ignore_errors=True)
+                os.makedirs(directory, exist_ok=True)
+                self._checkpoint_file = {"object": self._obj.name, "chunks": []}
+
+            chunks = self._checkpoint_file["chunks"]
+            frames = self._frames[self._file_frame_index:self._frame_index]
+            blocks = self._created_blocks[self._file_block_count:]
+            chunk = {
+                "file": f"chunk_{len(chunks)}.blend" if blocks else "",
+                "frame": frames[-1],
+                "keyframes": [[frame, int(self._baked_keyframes[frame])] for frame in frames],
+                "blocks": [],
+            }
+
+            """NOTE: Materials are written as names, so that they're not duplicated when blocks are loaded."""
+            materials = {}
+            for block in blocks:
+                slots = getattr(block, "materials", None)
+                materials[block] = [mat for mat in slots] if slots is not None else []
+                chunk["blocks"].append({"name": block.name,
+                                        "collection": checkpoint_collections[block.id_type],
+                                        "materials": [mat.name if mat else "" for mat in materials[block]]})
+
+            if blocks:
+                try:
+                    for block in blocks:
+                        for i in range(len(materials[block])):
+                            block.materials[i] = None
+                    bpy.data.libraries.write(os.path.join(directory, chunk["file"]), set(blocks), fake_user=True)
+                finally:
+                    for block in blocks:
+                        for i, mat in enumerate(materials[block]):
+                            block.materials[i] = mat
+
+            chunks.append(chunk)
+            self._checkpoint_file.update(checkpoint)
+            _write_json(os.path.join(directory, "checkpoint.json"), self._checkpoint_file)
+
+        except OSError as error:
+            self.report({'WARNING'}, f"Bake checkpoint couldn't be saved to the disk, bake can't be resumed after a crash: {error}")
+            self._checkpoint_dir = None
+            return
+
+        self._file_frame_index = self._frame_index
+        self._file_block_count = len(self._created_blocks)
+        self._last_file_write = time.time()
+
+
+    def _load_checkpoint_chunks(self, chunks):
+        """Loads blocks baked before Blender was closed from checkpoint chunk files, and inserts their keyframes."""
+
+        obj = self._obj
+        directory = self._checkpoint_dir
+
+        for chunk in chunks:
+            blocks = []
+            if chunk["file"]:
+                collections = {}
+                for block in chunk["blocks"]:
+                    collections.setdefault(block["collection"], []).append(block)
+
+                try:
+                    with bpy.data.libraries.load(os.path.join(directory, chunk["file"]), link=False) as (data_from, data_to):
+                        for collection, items in collections.items():
+                            setattr(data_to, collection, [item["name"] for item in items])
+                except OSError as error:
+                    self.report({'WARNING'}, f"Bake checkpoint couldn't be fully loaded, some frames will be baked again: {error}")
+                    break
+
+                for collection, items in collections.items():
+                    for item, block in zip(items, getattr(data_to, collection)):
+                        if block is None:
+                            continue
+                        for i, name in enumerate(item["materials"]):
+                            block.materials[i] = bpy.data.materials.get(name, None) if name else None
+                        blocks.append(block)
+
+            for block in blocks:
+                insert_block(obj, block, block.keymesh["Data"])
+
+            frames, values = zip(*chunk["keyframes"])
+            insert_keymesh_keyframes(obj, list(frames), list(values))
+            self._checkpoint["frame"] = chunk["frame"]
+            self._last_block_index = values[-1]
+
+
+    def _restore_checkpoint_file(self):
+        """Restores the checkpoint file to the state it was in before the bake, removing chunks written since."""
+
+        directory = self._checkpoint_dir
+        if directory is None:
+            return
+
+        initial = self._initial_checkpoint_file
+        if initial is None:
+            remove_checkpoint_dir(directory, self._obj)
+            return
+
+        written = {chunk["file"] for chunk in (self._checkpoint_file or initial)["chunks"]}
+        for file in written - {chunk["file"] for chunk in initial["chunks"]}:
+            if file and os.path.isfile(os.path.join(directory, file)):
+                os.remove(os.path.join(directory, file))
+
+        try:
+            _write_json(os.path.join(directory, "checkpoint.json"), initial)
+        except OSError:
+            pass
+
+
+    def _stop_modal(self, context):
+        self._stop_processes()
+
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
 
 
-                # Assign new block to the object.
-                new_block.name = obj.name + "_frame_" + str(frame)
-                block_index = get_next_keymesh_index(obj)
-                insert_block(obj, new_block, block_index)
+    def _bake_finish(self, context):
+        """Inserts keyframes, handles modifiers and the original object data, and restores the frame handler."""
 
+        obj = self._obj
+        original_type = self._original_type
+        original_data = self._original_data
+        selected_modifiers = self._selected_modifiers
 
-            # Insert Keyframe
-            insert_keymesh_keyframe(obj, context.scene.frame_current, block_index)
+        # Cancelled interactive bake only covers frames that were baked.
+        if self._frame_index < len(self._frames):
+            if self._frame_index > 0:
+                self.frame_end = self._frames[self._frame_index - 1]
+            elif self._checkpoint is not None:
+                self.frame_end = self._checkpoint["frame"]
 
+        # Remove blocks baked in parallel that turned out to be duplicates.
+        unused_parallel_blocks = list(self._duplicate_blocks)
+        if self._parallel_blocks is not None and self._frame_index < len(self._frames):
+            unused_parallel_blocks += [self._parallel_blocks[frame] for frame in self._frames[self._frame_index:]]
+        if unused_parallel_blocks:
+            bpy.data.batch_remove(unused_parallel_blocks)
+
+        # Insert Keyframes
+        self._insert_stored_keyframes()
+        if self._last_block_index is not None:
+            obj.keymesh["Keymesh Data"] = int(self._last_block_index)
 
         if self.bake_type == 'ALL' and self.has_modifiers:
             # a. Handle Modifiers
@@ -388,10 +1158,9 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
                 else:
                     block_index = get_next_keymesh_index(obj)
                     insert_block(obj, original_data, block_index)
-                    obj.keymesh.blocks.move(block_index, 0)
+                    obj.keymesh.blocks.move(len(obj.keymesh.blocks) - 1, 0)
 
-                insert_keymesh_keyframe(obj, self.frame_start - 1, block_index)
-                insert_keymesh_keyframe(obj, self.frame_end + 1, block_index)
+                insert_keymesh_keyframes(obj, [self.frame_start - 1, self.frame_end + 1], [block_index] * 2)
         else:
             if original_data.name not in obj.keymesh.blocks:
                 obj_type = obj_data_type(obj)
@@ -400,33 +1169,281 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
 
 
         # Remove userless shape keys IDs.
-        self._clean_up_shape_keys(garbage_shape_keys)
+        self._clean_up_shape_keys(self._garbage_shape_keys)
 
         # Finish
+        if obj.keymesh.get("Bake Checkpoint", None) is not None:
+            del obj.keymesh["Bake Checkpoint"]
+        if self._checkpoint_dir is not None:
+            remove_checkpoint_dir(self._checkpoint_dir, self._obj)
+
         obj.keymesh.animated = True
+        bpy.app.handlers.frame_change_pre.append(update_keymesh_pre)
         bpy.app.handlers.frame_change_post.append(update_keymesh)
         update_keymesh(context.scene, override=True)
-        context.scene.frame_set(initial_frame)
+        context.scene.frame_set(self._initial_frame)
 
         end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = end_time - self._start_time
         print("Keymesh bake operator executed in", str(round(execution_time, 4)), "seconds.")
 
-        return {'FINISHED'}
+        if self.instance_duplicates and self._merged_count > 0:
+            self.report({'INFO'}, str(self._merged_count) + " duplicate frame(s) were merged into existing Keymesh blocks")
+
+
+    def _bake_pause(self, context):
+        """Leaves the bake unfinished, with original object data and modifiers, so that it can be resumed later."""
+
+        obj = self._obj
+
+        if self._parallel_blocks is not None:
+            unused_parallel_blocks = self._duplicate_blocks + [self._parallel_blocks[frame]
+                                                               for frame in self._frames[self._frame_index:]]
+            if unused_parallel_blocks:
+                bpy.data.batch_remove(unused_parallel_blocks)
+
+        self._save_checkpoint(write_file=True)
+        self._clean_up_shape_keys(self._garbage_shape_keys)
+
+        """NOTE: Object isn't animated until the bake is finished, because baked blocks would be deformed by modifiers again."""
+        obj.data = self._original_data
+        obj.keymesh.animated = False
+
+        bpy.app.handlers.frame_change_pre.append(update_keymesh_pre)
+        bpy.app.handlers.frame_change_post.append(update_keymesh)
+        context.scene.frame_set(self._initial_frame)
+
+
+    def _bake_rollback(self, context):
+        """Removes everything that cancelled interactive bake has created, restoring the object to its previous state."""
+
+        obj = self._obj
+
+        # Restore Keyframes
+        """NOTE: Has to happen before blocks are removed, so that keyframes of merged duplicates are removed too."""
+        fcurve = get_keymesh_fcurve(obj)
+        if fcurve is not None:
+            restore_keyframes_in_range(obj, fcurve, *self._keyframes_range, self._keyframes_snapshot)
+
+        # Remove Baked Blocks
+        for block in self._created_blocks:
+            remove_block(obj, block)
+
+        removed_blocks = self._created_blocks + self._duplicate_blocks
+        if self._parallel_blocks is not None:
+            removed_blocks += [block for block in self._parallel_blocks.values() if block not in removed_blocks]
+        if removed_blocks:
+            bpy.data.batch_remove(removed_blocks)
+
+        obj.data = self._original_data
+
+        # Restore Object
+        if self._checkpoint is not None:
+            obj.keymesh["Bake Checkpoint"] = self._checkpoint
+            obj.keymesh.animated = False
+        elif obj.keymesh.get("Bake Checkpoint", None) is not None:
+            del obj.keymesh["Bake Checkpoint"]
+        self._restore_checkpoint_file()
+
+        if not self._was_keymesh and self._checkpoint is None:
+            remove_keymesh_properties(obj)
+        if self._created_backup:
+            bpy.data.objects.remove(self._backup_obj)
+
+        self._clean_up_shape_keys(self._garbage_shape_keys)
+
+        bpy.app.handlers.frame_change_pre.append(update_keymesh_pre)
+        bpy.app.handlers.frame_change_post.append(update_keymesh)
+        context.scene.frame_set(self._initial_frame)
+
+
+    def _can_bake_in_parallel(self, context, obj, frames) -> bool:
+        """Checks if the frame range can be split between multiple background processes."""
+
+        if self.processes < 2 or len(frames) < 2:
+            return False
+        if not (obj.type == 'MESH' and self.bake_type == 'ALL' and self.has_modifiers):
+            return False
+
+        simulations = find_unbaked_simulations(context.scene, obj)
+        if simulations:
+            self.report({'WARNING'}, "Simulations can't be baked in parallel (" + ", ".join(simulations) + "). Baking in a single process")
+            return False
+
+        return True
+
+
+    def _wait_for_processes(self, context) -> dict:
+        """
+        Waits for started background processes to finish baking.
+        Only used without a window (e.g. in background mode), where bake can't be cancelled.
+        Returns `dict` of frames and baked meshes, or `None` if any process failed or timed out.
+        """
+
+        wm = context.window_manager
+        wm.progress_begin(0, self._workers["frames"])
+        try:
+            while True:
+                status, baked_count = self._poll_processes()
+                wm.progress_update(baked_count)
+                if status == 'FINISHED':
+                    return self._collect_processes()
+                if status == 'TIMEOUT':
+                    return None
+                time.sleep(0.1)
+
+        finally:
+            wm.progress_end()
+            self._stop_processes()
+
+
+    def _start_processes(self, context, obj, selected_modifiers, frames) -> bool:
+        """
+        Starts background Blender processes, each of which bakes its own part of the frame range
+        from a temporary copy of the .blend file and writes baked meshes into a separate file.
+        Returns `False` if processes couldn't be started.
+        """
+
+        temp_dir = tempfile.mkdtemp(prefix="keymesh_bake_")
+        self._workers = {"temp_dir": temp_dir, "processes": [], "frames": len(frames),
+                         "log_sizes": None, "last_activity": time.time()}
+
+        # Save Temporary Copy (with only selected modifiers enabled).
+        temp_file = os.path.join(temp_dir, "bake.blend")
+        try:
+            with self._disable_unselected_modifiers(obj, selected_modifiers):
+                bpy.ops.wm.save_as_mainfile(filepath=temp_file, copy=True)
+        except RuntimeError as error:
+            self._stop_processes()
+            self.report({'WARNING'}, f"Temporary copy of the file couldn't be saved for parallel baking, baking in a single process: {error}")
+            return False
+
+        # Start Processes
+        worker_script = os.path.join(os.path.dirname(os.path.dirname(__file__)), "functions", "bake_worker.py")
+        auto_exec = "-y" if context.preferences.filepaths.use_scripts_auto_execute else "-Y"
+        chunks = [chunk for chunk in numpy.array_split(numpy.array(frames), self.processes) if len(chunk) > 0]
+
+        for i, chunk in enumerate(chunks):
+            output = os.path.join(temp_dir, f"frames_{i}.blend")
+            log_path = os.path.join(temp_dir, f"frames_{i}.log")
+            args = json.dumps({"object": obj.name, "frames": chunk.tolist(), "output": output})
+
+            try:
+                with open(log_path, 'w') as log:
+                    process = subprocess.Popen([bpy.app.binary_path, "-b", "--factory-startup", auto_exec, temp_file,
+                                                "--python", worker_script, "--", args],
+                                               stdout=log, stderr=subprocess.STDOUT)
+            except OSError as error:
+                # Processes that were already started are stopped.
+                self._stop_processes()
+                self.report({'WARNING'}, f"Processes couldn't be started for parallel baking, baking in a single process: {error}")
+                return False
+
+            self._workers["processes"].append((process, output, log_path))
+
+        return True
+
+
+    def _poll_processes(self) -> tuple:
+        """
+        Checks the state of background processes without waiting for them.
+
+        Returns:
+            tuple:
+                status (str): 'RUNNING', 'FINISHED' (all processes exited), or 'TIMEOUT'.
+                baked_count (int): number of frames that processes have baked so far.
+        """
+
+        processes = self._workers["processes"]
+        finished = all(process.poll() is not None for process, __, __ in processes)
+
+        # Processes print a line for each baked frame.
+        baked_count = 0
+        log_sizes = []
+        for __, __, log_path in processes:
+            with open(log_path, 'r', errors='replace') as log:
+                content = log.read()
+            baked_count += content.count(bake_worker_marker)
+            log_sizes.append(len(content))
+
+        """
+        NOTE: Process is considered to be stuck if none of the processes have written anything in
+        their logs for the given time, since they log every frame they bake. Frames can't be baked
+        while they're stuck, so all of them are stopped and bake is cancelled.
+        """
+        if log_sizes != self._workers["log_sizes"]:
+            self._workers["log_sizes"] = log_sizes
+            self._workers["last_activity"] = time.time()
+        elif not finished and time.time() - self._workers["last_activity"] > self.process_timeout:
+            self.report({'ERROR'}, "Parallel baking stopped responding for " + str(self.process_timeout) + " seconds and was cancelled")
+            return 'TIMEOUT', baked_count
+
+        return ('FINISHED' if finished else 'RUNNING'), baked_count
+
+
+    def _collect_processes(self) -> dict:
+        """Appends meshes baked by finished processes. Returns `dict` of frames and meshes, or `None` if any process failed."""
+
+        processes = self._workers["processes"]
+
+        for process, output, log_path in processes:
+            if process.returncode != 0 or not os.path.isfile(output):
+                with open(log_path, 'r', errors='replace') as log:
+                    print(log.read())
+                self.report({'ERROR'}, "Parallel baking failed, see the system console for details")
+                return None
+
+        # Append Baked Meshes
+        blocks = {}
+        for __, output, __ in processes:
+            with bpy.data.libraries.load(output, link=False) as (data_from, data_to):
+                data_to.meshes = data_from.meshes
+
+            for mesh in data_to.meshes:
+                if mesh is None:
+                    continue
+
+                frame = int(mesh["keymesh_bake_frame"])
+                materials = list(mesh["keymesh_bake_materials"])
+                del mesh["keymesh_bake_frame"]
+                del mesh["keymesh_bake_materials"]
+
+                for i, name in enumerate(materials):
+                    mesh.materials[i] = bpy.data.materials.get(name, None) if name else None
+                blocks[frame] = mesh
+
+        if len(blocks) < self._workers["frames"]:
+            bpy.data.batch_remove(list(blocks.values()))
+            self.report({'ERROR'}, "Parallel baking failed, some frames are missing from the result")
+            return None
+
+        return blocks
+
+
+    def _stop_processes(self):
+        """Kills processes that are still running and removes their temporary files."""
+
+        if self._workers is None:
+            return
+
+        for process, __, __ in self._workers["processes"]:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+        shutil.rmtree(self._workers["temp_dir"], ignore_errors=True)
+        self._workers = None
 
 
     def _detect_duplicate(self, context, obj, data, unique_verts_dict, unique_shape_keys_dict):
         """
-        Checks if the exact match of the evaluated mesh (on the current frame)
-        has already been created in the loop. Compares the array of evaluated meshes
-        vertex positions to other arrays in `unique_verts_dict` and if the match is found
-        returns the key (Keymesh block). If the match is not found, the array is added
-        to the dict as unique.
+        Checks if the match of the evaluated mesh (on the current frame)
+        has already been created in the loop.
 
         Returns:
             tuple:
-                verts_co: `numpy.ndarray` of vertex coordinates of the evaluated object.
-                          `None` if only checking shape keys.
+                verts: `tuple` of digest and `numpy.ndarray` of vertex coordinates of the evaluated object.
+                       `None` if only checking shape keys.
                 sk_values: `tuple` of values of all shape keys.
                            `None` if not checking for shape keys only.
                 match (int or None): index of a block with same vertex positions or shape key values.
@@ -434,7 +1451,7 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
 
         match = None
         sk_values = None
-        verts_co = None
+        verts = None
 
         # Compare (only) shape key values.
         if self.bake_type == 'SHAPE_KEYS' and self.has_shape_keys:
@@ -452,16 +1469,124 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
         elif self.bake_type == 'ALL':
             depsgraph = context.evaluated_depsgraph_get()
             eval_obj = obj.evaluated_get(depsgraph)
+            verts, match = self._match_vertices(eval_obj.data.vertices, unique_verts_dict)
+
+        return verts, sk_values, match
 
-            verts_co = numpy.empty((len(eval_obj.data.vertices) * 3), dtype=numpy.float64)
-            eval_obj.data.vertices.foreach_get("co", verts_co)
 
-            for key, values in unique_verts_dict.items():
+    def _match_vertices(self, vertices, unique_verts_dict):
+        """
+        Hashes vertex positions and looks them up in `unique_verts_dict` (`{digest: [(block, verts_co)]}`).
+        Only arrays with the same digest are compared to confirm the match, either exactly
+        or within `self.duplicate_threshold`.
+
+        Returns:
+            tuple:
+                verts: `tuple` of digest and `numpy.ndarray` of vertex coordinates. Array is reused on every call.
+                match: Keymesh block with same (or close enough) vertex positions, or `None`.
+        """
+
+        match = None
+
+        # Buffer is only reallocated when the number of vertices changes.
+        if self._verts_buffer is None or len(self._verts_buffer) != len(vertices) * 3:
+            self._verts_buffer = numpy.empty(len(vertices) * 3, dtype=numpy.float32)
+        verts_co = self._verts_buffer
+        vertices.foreach_get("co", verts_co)
+
+        # Adding zero turns `-0.0` into `0.0`, so that equal positions have equal bytes.
+        verts_co += 0.0
+
+        if self.duplicate_threshold > 0.0:
+            """
+            NOTE: In tolerance mode positions are snapped to the grid with the size of the threshold
+            before hashing, so that frames with only tiny differences get the same digest. Vertices that
+            fall on the other side of the grid line are missed by the hash, so the block that was
+            created or reused on the previous frame (i.e. held pose) is always checked as well.
+            """
+            if self._quantized_buffer is None or len(self._quantized_buffer) != len(verts_co):
+                self._quantized_buffer = numpy.empty(len(verts_co), dtype=numpy.float64)
+            quantized = self._quantized_buffer
+            numpy.divide(verts_co, self.duplicate_threshold, out=quantized)
+            numpy.rint(quantized, out=quantized)
+            quantized += 0.0
+
+            digest = hashlib.blake2b(quantized, digest_size=16).digest()
+            candidates = list(unique_verts_dict.get(digest, ()))
+            if self._last_unique is not None:
+                candidates.append(self._last_unique)
+
+            for candidate in candidates:
+                block, values = candidate
+                if len(values) != len(verts_co):
+                    continue
+
+                # Distance every vertex moved between frames.
+                distances = numpy.linalg.norm((verts_co - values).reshape(-1, 3), axis=1)
+                if numpy.max(distances, initial=0.0) <= self.duplicate_threshold:
+                    match = block
+                    self._last_unique = candidate
+                    break
+
+        else:
+            digest = hashlib.blake2b(verts_co, digest_size=16).digest()
+            for block, values in unique_verts_dict.get(digest, ()):
                 if numpy.array_equal(verts_co, values):
-                    match = key
+                    match = block
                     break
 
-        return verts_co, sk_values, match
+        verts = (digest, verts_co)
+
+        return verts, match
+
+
+    def _set_template(self, mesh):
+        """Makes the mesh a template that next frames are copied from, as long as their topology is the same."""
+
+        if mesh.has_custom_normals:
+            self._template = None
+            return
+
+        corner_verts = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+        mesh.loops.foreach_get("vertex_index", corner_verts)
+
+        self._template = mesh
+        self._template_counts = (len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+        self._template_corner_verts = corner_verts
+        self._corner_buffer = numpy.empty_like(corner_verts)
+        self._positions_buffer = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+
+
+    def _copy_template(self, context, obj):
+        """
+        Returns the copy of the template mesh with vertex positions of the evaluated object,
+        which is much faster than creating new mesh from the evaluated object (with all data layers).
+        Returns `None` if topology of the evaluated mesh is different from the template.
+        """
+
+        if self._template is None:
+            return None
+
+        depsgraph = context.evaluated_depsgraph_get()
+        eval_mesh = obj.evaluated_get(depsgraph).data
+
+        # Compare Topology
+        counts = (len(eval_mesh.vertices), len(eval_mesh.edges), len(eval_mesh.loops), len(eval_mesh.polygons))
+        if counts != self._template_counts or eval_mesh.has_custom_normals:
+            return None
+
+        eval_mesh.loops.foreach_get("vertex_index", self._corner_buffer)
+        if not numpy.array_equal(self._corner_buffer, self._template_corner_verts):
+            return None
+
+        # Copy Positions
+        """NOTE: Normals don't need to be copied, they're recalculated from the new positions."""
+        eval_mesh.vertices.foreach_get("co", self._positions_buffer)
+        new_block = self._template.copy()
+        new_block.vertices.foreach_set("co", self._positions_buffer)
+        new_block.update()
+
+        return new_block
 
 
     @contextmanager
@@ -585,37 +1710,17 @@ class ANIM_OT_bake_to_keymesh(bpy.types.Operator):
 
                 # Animate Modifier Visibility
                 elif self.modifier_handling == 'ANIMATE':
-                    if mod.show_viewport:
-                        if self.frame_start != context.scene.frame_start:
-                            mod.show_viewport = True
-                            insert_keyframe(obj, context.scene.frame_start,
-                                            f'modifiers["{mod.name}"].show_viewport',
-                                            constant=False)
-
-                        mod.show_viewport = False
-                        insert_keyframe(obj, self.frame_start,
-                                        f'modifiers["{mod.name}"].show_viewport',
-                                        constant=False)
-                        mod.show_viewport = True
-                        insert_keyframe(obj, self.frame_end + 1,
-                                        f'modifiers["{mod.name}"].show_viewport',
-                                        constant=False)
-
-                    if mod.show_render:
-                        if self.frame_start != context.scene.frame_start:
-                            mod.show_render = True
-                            insert_keyframe(obj, context.scene.frame_start,
-                                            f'modifiers["{mod.name}"].show_render',
-                                            constant=False)
-
-                        mod.show_render = False
-                        insert_keyframe(obj, self.frame_start,
-                                        f'modifiers["{mod.name}"].show_render',
-                                        constant=False)
-                        mod.show_render = True
-                        insert_keyframe(obj, self.frame_end + 1,
-                                        f'modifiers["{mod.name}"].show_render',
-                                        constant=False)
+                    for prop in ("show_viewport", "show_render"):
+                        if getattr(mod, prop):
+                            frames = [self.frame_start, self.frame_end + 1]
+                            values = [False, True]
+                            if self.frame_start != context.scene.frame_start:
+                                frames.insert(0, context.scene.frame_start)
+                                values.insert(0, True)
+
+                            insert_keyframes(obj, frames, values,
+                                             f'modifiers["{mod.name}"].{prop}',
+                                             constant=False)
 
 
     def _clean_up_shape_keys(self, garbage_shape_keys):
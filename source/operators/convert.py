@@ -8,10 +8,11 @@ from ..functions.poll import (
     is_keymesh_object,
 )
 from ..functions.timeline import (
-    insert_keyframe,
+    insert_keyframes,
     has_driver,
-    get_keymesh_keyframes,
-    keymesh_block_usage_count,
+    can_evaluate_directly,
+    get_keymesh_timing,
+    get_keymesh_block_usage,
 )
 
 
@@ -205,6 +206,7 @@ class OBJECT_OT_keymesh_convert(bpy.types.Operator):
         # 'STATIC' Workflow
         previous_obj = None
         duplicates = {}
+        self._visibility_keyframes = {}
         for block in obj.keymesh.blocks:
             if self.skip_unused and block in unused_blocks:
                 continue
@@ -239,28 +241,29 @@ class OBJECT_OT_keymesh_convert(bpy.types.Operator):
             previous_obj = None
             previous_index = None
 
-            for frame in (keymesh_keyframes := get_keymesh_keyframes(obj)):
-                context.scene.frame_set(frame)
-                current_index = obj.keymesh["Keymesh Data"]
-
+            keyframe_values = self._keymesh_keyframe_values(context, obj)
+            for frame, current_index in keyframe_values:
                 # 'SIMPLE (Keyframing)' Method (animate the visibility of objects)
                 if self.convert_method == 'SIMPLE':
                     dup_obj = next((obj for obj, value in duplicates.items() if value == current_index), None)
                     if current_index != previous_index:
-                        self._workflow_keyframe(context, dup_obj, previous_obj, current_index, previous_index)
+                        self._workflow_keyframe(dup_obj, previous_obj, frame)
 
                     previous_obj = dup_obj
                     previous_index = current_index
 
+            if keyframe_values:
+                frames, values = zip(*keyframe_values)
+
                 # 'DRIVER' Method (animate the custom property that drives the visibility)
                 if self.convert_method == 'DRIVER':
-                    driver_obj[self.custom_prop_name] = current_index
-                    insert_keyframe(driver_obj, frame, f'["{self.custom_prop_name}"]', constant=True)
+                    insert_keyframes(driver_obj, frames, values, f'["{self.custom_prop_name}"]', constant=True)
 
                 # 'GEONODES' Method (animate the modifier input)
                 if self.convert_method == 'GEONODES':
-                    self.geonodes_mod["Socket_1"] = current_index
-                    insert_keyframe(self.geonodes_obj, frame, 'modifiers["keymesh_convert"]["Socket_1"]', constant=True)
+                    insert_keyframes(self.geonodes_obj, frames, values, 'modifiers["keymesh_convert"]["Socket_1"]', constant=True)
+
+        self._insert_visibility_keyframes()
 
         obj.select_set(False)
         obj.hide_set(True)
@@ -277,30 +280,61 @@ class OBJECT_OT_keymesh_convert(bpy.types.Operator):
 
         unused_blocks = []
         if self.workflow == 'ANIMATED':
+            usage = get_keymesh_block_usage(obj)
             for block in obj.keymesh.blocks:
-                usage_count, __ = keymesh_block_usage_count(obj, block.block)
-                if usage_count == 0:
+                if usage.get(block.block.keymesh["Data"], 0) == 0:
                     unused_blocks.append(block)
 
         return unused_blocks
 
 
+    def _keymesh_keyframe_values(self, context, obj) -> list:
+        """
+        Returns the list of `(frame, value)` pairs for each Keymesh keyframe of the object.
+        Values are read directly from keyframes when possible, and by evaluating the scene
+        on each keyframe when Keymesh value is driven or affected by NLA.
+        """
+
+        timing = get_keymesh_timing(obj)
+        if timing is None:
+            return []
+
+        frames = timing["frames"].astype(int).tolist()
+        if can_evaluate_directly(context.scene, obj) and timing["constant"]:
+            values = timing["values"].astype(int).tolist()
+        else:
+            values = []
+            for frame in frames:
+                context.scene.frame_set(frame)
+                values.append(obj.keymesh["Keymesh Data"])
+
+        return list(zip(frames, values))
+
+
     def _animate_visibility(self, obj, frame: int, value: bool):
-        """Insert keyframes for objects viewport & render visibility."""
+        """Stores keyframes for objects viewport & render visibility, to be inserted all at once later."""
+
+        for path in ("hide_viewport", "hide_render"):
+            frames, values = self._visibility_keyframes.setdefault((obj, path), ([], []))
+            frames.append(frame)
+            values.append(value)
+
+
+    def _insert_visibility_keyframes(self):
+        """Inserts all stored visibility keyframes, one batch per object and data-path."""
+
+        for (obj, path), (frames, values) in self._visibility_keyframes.items():
+            insert_keyframes(obj, frames, values, path, constant=False)
 
-        obj.hide_viewport = value
-        insert_keyframe(obj, frame, "hide_viewport", constant=False)
-        obj.hide_render = value
-        insert_keyframe(obj, frame, "hide_render", constant=False)
+        self._visibility_keyframes.clear()
 
 
-    def _workflow_keyframe(self, context, dup_obj, prev_obj):
+    def _workflow_keyframe(self, dup_obj, prev_obj, frame: int):
         """
         Animate the render & viewport visibility of the newly created object,
         as well as the previous object to hide it.
         """
 
-        frame = context.scene.frame_current
         self._animate_visibility(dup_obj, frame, False)
 
         if prev_obj is not None:
@@ -1,5 +1,8 @@
 import bpy
 
+from ..functions.handler import (
+    refresh_keymesh_objects,
+)
 from ..functions.object import (
     update_active_index,
 )
@@ -67,11 +70,9 @@ class OBJECT_OT_keymesh_block_keyframe(bpy.types.Operator):
         if has_shared_action_slot(obj):
             """
             NOTE: This refresh happens when objects action slot is used by other Keymesh objects as well.
-            Even though property is animated, it's not updated on other objects until the timeline is refreshed.
+            Even though property is animated, it's not updated on other objects until they're re-resolved.
             """
-            current_frame = context.scene.frame_current
-            context.scene.frame_set(current_frame + 1)
-            context.scene.frame_set(current_frame)
+            refresh_keymesh_objects([obj])
 
         return {'FINISHED'}
 
@@ -2,6 +2,7 @@ import bpy
 
 from ..functions.handler import (
     update_keymesh,
+    update_keymesh_pre,
 )
 
 
@@ -18,8 +19,11 @@ class SCENE_OT_keymesh_handler_initialize(bpy.types.Operator):
         return True
 
     def execute(self, context):
-        bpy.app.handlers.frame_change_post.remove(update_keymesh)
-        bpy.app.handlers.frame_change_post.append(update_keymesh)
+        for handler, function in ((bpy.app.handlers.frame_change_pre, update_keymesh_pre),
+                                  (bpy.app.handlers.frame_change_post, update_keymesh)):
+            if function in handler:
+                handler.remove(function)
+            handler.append(function)
         update_keymesh(context.scene)
 
         if context.scene.keymesh.enable_handler == False:
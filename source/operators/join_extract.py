@@ -1,5 +1,11 @@
 import bpy
 
+from ..functions.cache import (
+    invalidate_block_map,
+)
+from ..functions.handler import (
+    refresh_keymesh_objects,
+)
 from ..functions.object import (
     get_next_keymesh_index,
     assign_keymesh_id,
@@ -81,6 +87,7 @@ class OBJECT_OT_keymesh_join(bpy.types.Operator):
                     self._transfer_block(target, source.data)
 
                 # remove_source_object
+                invalidate_block_map(source)
                 bpy.data.objects.remove(source)
 
         return {'FINISHED'}
@@ -133,10 +140,8 @@ class OBJECT_OT_keymesh_block_extract(bpy.types.Operator):
         else:
             # set_new_active_block
             if obj.keymesh.animated:
-                """NOTE: Refreshing the timeline to update objects "Keymesh Data" property."""
-                current_frame = context.scene.frame_current
-                context.scene.frame_set(current_frame + 1)
-                context.scene.frame_set(current_frame)
+                """NOTE: Re-resolving the object, because its current block was removed."""
+                refresh_keymesh_objects([obj])
                 update_active_index(obj)
             else:
                 # Make the previous block new `obj.data` for static Keymesh objects.
@@ -0,0 +1,95 @@
+import bpy
+import json
+import os
+
+from ..functions.profiler import (
+    clear_samples,
+    has_samples,
+    get_samples,
+    get_stats,
+)
+
+
+#### ------------------------------ OPERATORS ------------------------------ ####
+
+class SCENE_OT_keymesh_profiler_export(bpy.types.Operator):
+    bl_idname = "scene.keymesh_profiler_export"
+    bl_label = "Export Keymesh Profiler Data"
+    bl_description = "Export recorded frame handler timings and per-object stats to a JSON file"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(
+        name = "File Path",
+        subtype = 'FILE_PATH',
+        options = {'SKIP_SAVE'},
+    )
+    filter_glob: bpy.props.StringProperty(
+        default = "*.json",
+        options = {'HIDDEN'},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        if not has_samples():
+            cls.poll_message_set("No frame handler timings were recorded yet")
+            return False
+
+        return True
+
+    def invoke(self, context, event):
+        if self.filepath == "":
+            blend_name = os.path.splitext(bpy.path.basename(bpy.data.filepath))[0] or "untitled"
+            self.filepath = blend_name + "_keymesh_profile.json"
+
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+
+        data = {
+            "blender": bpy.app.version_string,
+            "file": bpy.data.filepath,
+            "scene": context.scene.name,
+            "fps": context.scene.render.fps / context.scene.render.fps_base,
+            "stats": get_stats(),
+            "samples": get_samples(),
+        }
+
+        try:
+            with open(filepath, 'w', encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+        except OSError as error:
+            self.report({'ERROR'}, f"Profiler data couldn't be exported: {error}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Profiler data exported to " + filepath)
+        return {'FINISHED'}
+
+
+class SCENE_OT_keymesh_profiler_clear(bpy.types.Operator):
+    bl_idname = "scene.keymesh_profiler_clear"
+    bl_label = "Clear Keymesh Profiler Data"
+    bl_description = "Remove all recorded frame handler timings"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        clear_samples()
+        return {'FINISHED'}
+
+
+
+#### ------------------------------ REGISTRATION ------------------------------ ####
+
+classes = [
+    SCENE_OT_keymesh_profiler_export,
+    SCENE_OT_keymesh_profiler_clear,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
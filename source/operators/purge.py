@@ -1,5 +1,8 @@
 import bpy
 
+from ..functions.cache import (
+    invalidate_block_map,
+)
 from ..functions.object import (
     remove_block,
     remove_keymesh_properties,
@@ -9,12 +12,106 @@ from ..functions.poll import (
     is_linked,
     is_keymesh_object,
     obj_data_type,
+    supported_types,
 )
 from ..functions.timeline import (
-    get_keymesh_fcurve,
+    get_keymesh_block_usage,
 )
 
 
+#### ------------------------------ FUNCTIONS ------------------------------ ####
+
+# Size of one element of the attribute in bytes, for each attribute data type.
+attribute_sizes = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT16_2D': 4,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+
+def find_orphaned_blocks() -> list:
+    """
+    Returns the list of local Keymesh blocks in the .blend file that aren't in the blocks registry
+    of any object and aren't used by anything other than their fake user. Those blocks are left
+    behind by deleted objects, crashes, interrupted bakes, and copies made by other operators.
+    """
+
+    # Blocks that are in the registry of any object.
+    registered = set()
+    for obj in bpy.data.objects:
+        if obj.keymesh.active:
+            for block in obj.keymesh.blocks:
+                if block.block is not None:
+                    registered.add(block.block.session_uid)
+
+    # `bpy.data.curves` is shared by multiple object types.
+    collections = []
+    for __, data_type in supported_types():
+        if data_type not in collections:
+            collections.append(data_type)
+
+    orphaned = []
+    for data_type in collections:
+        for block in data_type:
+            if block.library is not None:
+                continue
+            if block.keymesh.get("ID", None) is None:
+                continue
+            if block.session_uid in registered:
+                continue
+            if block.users - int(block.use_fake_user) > 0:
+                continue
+            orphaned.append(block)
+
+    return orphaned
+
+
+def estimate_block_size(block) -> int:
+    """Returns the rough estimate of memory (in bytes) used by the geometry of a data-block."""
+
+    # Meshes and hair curves.
+    attributes = getattr(block, "attributes", None)
+    if attributes is not None:
+        size = 0
+        for attribute in attributes:
+            size += len(attribute.data) * attribute_sizes.get(attribute.data_type, 4)
+        if isinstance(block, bpy.types.Mesh):
+            # Face offsets.
+            size += len(block.polygons) * 4
+        return size
+
+    # Legacy curves, surfaces & text.
+    if isinstance(block, bpy.types.Curve):
+        size = 0
+        for spline in block.splines:
+            size += len(spline.bezier_points) * 48 + len(spline.points) * 16
+        return size
+
+    if isinstance(block, bpy.types.Lattice):
+        return len(block.points) * 24
+
+    return 0
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GB"
+
+
+
 #### ------------------------------ OPERATORS ------------------------------ ####
 
 class OBJECT_OT_keymesh_purge(bpy.types.Operator):
@@ -71,43 +168,41 @@ class OBJECT_OT_keymesh_purge(bpy.types.Operator):
             filtered_objects = [context.active_object]
 
         # list_used_keymesh_blocks
+        """
+        NOTE: Objects that share the Keymesh ID share blocks, so
+        block is used if it's keyframed in the animation of any of them.
+        """
         used_keymesh_blocks = {}
         for obj in filtered_objects:
-            obj_keymesh_id = obj.keymesh.get("ID")
-            used_keymesh_blocks[obj_keymesh_id] = []
-
-            fcurve = get_keymesh_fcurve(obj)
-            if fcurve:
-                keyframe_points = fcurve.keyframe_points
-                for keyframe in reversed(keyframe_points):
-                    if keyframe.co.y not in used_keymesh_blocks[obj_keymesh_id]:
-                        used_keymesh_blocks[obj_keymesh_id].append(keyframe.co.y)
+            used_values = used_keymesh_blocks.setdefault(obj.keymesh.get("ID"), set())
+            used_values.update(get_keymesh_block_usage(obj))
 
 
-        purged_blocks_count = 0
+        # List Unused Blocks
+        unused_blocks = {}
         for obj in filtered_objects:
-            obj_keymesh_id = obj.keymesh.get("ID")
+            used_values = used_keymesh_blocks[obj.keymesh.get("ID")]
 
-            # List Unused Blocks
-            unused_blocks = []
-            for block in obj.keymesh.blocks:
-                block_keymesh_data = block.block.keymesh.get("Data")
-                if block_keymesh_data not in used_keymesh_blocks[obj_keymesh_id]:
-                    if block.block != obj.data:
-                        unused_blocks.append(block.block)
-                        purged_blocks_count += 1
-                        continue
+            unused_indices = []
+            for index, block in enumerate(obj.keymesh.blocks):
+                if block.block is None:
+                    unused_indices.append(index)
+                    continue
 
-            # Purge Unused Blocks
-            for block in unused_blocks:
-                block.use_fake_user = False
+                if block.block.keymesh.get("Data") not in used_values and block.block != obj.data:
+                    unused_indices.append(index)
+                    unused_blocks[block.block.session_uid] = block.block
 
-                for index, mesh_ref in enumerate(obj.keymesh.blocks):
-                    if mesh_ref.block == block:
-                        obj.keymesh.blocks.remove(index)
+            # Remove them from the blocks registry.
+            for index in reversed(unused_indices):
+                obj.keymesh.blocks.remove(index)
+            if unused_indices:
+                invalidate_block_map(obj)
 
-                obj_type = obj_data_type(obj)
-                obj_type.remove(block)
+        # Purge Unused Blocks
+        purged_blocks_count = len(unused_blocks)
+        if purged_blocks_count > 0:
+            bpy.data.batch_remove(list(unused_blocks.values()))
 
 
         # Info
@@ -178,11 +273,58 @@ class OBJECT_OT_keymesh_block_remove(bpy.types.Operator):
 
 
 
+class SCENE_OT_keymesh_collect_garbage(bpy.types.Operator):
+    bl_idname = "scene.keymesh_collect_garbage"
+    bl_label = "Remove Orphaned Keymesh Blocks"
+    bl_description = ("Remove Keymesh blocks that don't belong to any object anymore from the .blend file.\n"
+                      "Those are blocks left behind by deleted objects, crashes, or interrupted bakes")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    orphaned_count: bpy.props.IntProperty(
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    )
+    orphaned_size: bpy.props.FloatProperty(
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    def invoke(self, context, event):
+        orphaned_blocks = find_orphaned_blocks()
+        if len(orphaned_blocks) == 0:
+            self.report({'INFO'}, "No orphaned Keymesh blocks were found")
+            return {'CANCELLED'}
+
+        self.orphaned_count = len(orphaned_blocks)
+        self.orphaned_size = sum(estimate_block_size(block) for block in orphaned_blocks)
+
+        return context.window_manager.invoke_props_dialog(self, width=300, confirm_text="Remove")
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text=str(self.orphaned_count) + " orphaned Keymesh block(s) found")
+        layout.label(text="Estimated reclaimable memory: " + format_size(int(self.orphaned_size)))
+
+    def execute(self, context):
+        orphaned_blocks = find_orphaned_blocks()
+        if len(orphaned_blocks) == 0:
+            self.report({'INFO'}, "No orphaned Keymesh blocks were found")
+            return {'CANCELLED'}
+
+        size = sum(estimate_block_size(block) for block in orphaned_blocks)
+        count = len(orphaned_blocks)
+        bpy.data.batch_remove(orphaned_blocks)
+
+        self.report({'INFO'}, str(count) + " orphaned Keymesh block(s) removed, " +
+                              "around " + format_size(size) + " reclaimed")
+        return {'FINISHED'}
+
+
+
 #### ------------------------------ REGISTRATION ------------------------------ ####
 
 classes = [
     OBJECT_OT_keymesh_purge,
     OBJECT_OT_keymesh_block_remove,
+    SCENE_OT_keymesh_collect_garbage,
 ]
 
 def register():
@@ -1,10 +1,14 @@
 import bpy
+import numpy
 
+from ..functions.cache import (
+    get_keymesh_objects,
+)
 from ..functions.poll import (
     is_keymesh_object,
 )
 from ..functions.timeline import (
-    get_keymesh_keyframes,
+    get_keymesh_timing,
 )
 
 
@@ -13,7 +17,7 @@ from ..functions.timeline import (
 class TIMELINE_OT_keymesh_frame_jump(bpy.types.Operator):
     bl_idname = "timeline.keymesh_frame_jump"
     bl_label = "Jump to Next Keymesh Keyframe"
-    bl_description = "Jump to the next frame that has a Keymesh keyframe for the current object"
+    bl_description = "Jump to the next frame that has a Keymesh keyframe for the current object(s)"
 
     path: bpy.props.EnumProperty(
         name = "Direction",
@@ -21,48 +25,87 @@ class TIMELINE_OT_keymesh_frame_jump(bpy.types.Operator):
                  ('BACKWARD', "Backward", "Jump to previous Keymesh keyframe")),
         default = 'FORWARD',
     )
+    scope: bpy.props.EnumProperty(
+        name = "Scope",
+        description = "Whose Keymesh keyframes are used. When not set, scene's \"Jump Between\" setting is used",
+        items = (('ACTIVE', "Active Object", "Jump between Keymesh keyframes of the active object"),
+                 ('SELECTED', "Selected Objects", "Jump between Keymesh keyframes of all selected Keymesh objects"),
+                 ('VISIBLE', "Visible Objects", "Jump between Keymesh keyframes of all visible Keymesh objects")),
+        default = 'ACTIVE',
+    )
 
     @classmethod
     def poll(cls, context):
-        if not context.active_object:
-            return False
         obj = context.active_object
-        if not is_keymesh_object(obj):
-            return False
-        if not obj.keymesh.animated:
-            cls.poll_message_set("Active object does not have a Keymesh animation")
-            return False
+        if obj and is_keymesh_object(obj) and obj.keymesh.animated:
+            return True
 
-        return True
+        # Other scopes don't need an active object.
+        if any(obj.keymesh.animated for obj in get_keymesh_objects(context.scene, context.view_layer)):
+            return True
 
-    def execute(self, context):
-        keyframes = get_keymesh_keyframes(context.active_object)
-
-        if self.path == 'BACKWARD':
-            if len(keyframes) > 0:
-                keyframes = [k for k in keyframes if k < context.scene.frame_current]
-            if len(keyframes) > 0:
-                highest = keyframes[0]
-                for num in keyframes:
-                    if num > highest:
-                        highest = num
-
-                context.scene.frame_current = highest
-
-        elif self.path == 'FORWARD':
-            if len(keyframes) > 0:
-                keyframes = [k for k in keyframes if k > context.scene.frame_current]
-            if len(keyframes) > 0:
-                lowest = keyframes[0]
-                for num in keyframes:
-                    if num < lowest:
-                        lowest = num
-
-                context.scene.frame_current = lowest
+        cls.poll_message_set("There are no objects with a Keymesh animation")
+        return False
+
+    def invoke(self, context, event):
+        # Shortcuts and buttons follow the scene setting.
+        if not self.properties.is_property_set("scope"):
+            self.scope = context.scene.keymesh.jump_scope
+
+        return self.execute(context)
 
+    def execute(self, context):
+        current_frame = context.scene.frame_current
+
+        objects = self._scope_objects(context)
+        if not objects:
+            scope_name = self.bl_rna.properties["scope"].enum_items[self.scope].name
+            self.report({'INFO'}, "No Keymesh animation to jump between (" + scope_name + ")")
+            return {'CANCELLED'}
+
+        """
+        NOTE: Keyframes of each object are already sorted and cached, so instead of merging them
+        into one timeline, the nearest keyframe is found with bisection for each object, and the
+        closest of those is the nearest keyframe of the merged timeline.
+        """
+        nearest = None
+        for obj in objects:
+            timing = get_keymesh_timing(obj)
+            if timing is None:
+                continue
+
+            frames = timing["frames"]
+            if self.path == 'BACKWARD':
+                i = int(numpy.searchsorted(frames, current_frame, side='left')) - 1
+                if i >= 0:
+                    frame = int(frames[i])
+                    nearest = frame if nearest is None else max(nearest, frame)
+
+            elif self.path == 'FORWARD':
+                i = int(numpy.searchsorted(frames, current_frame, side='right'))
+                if i < len(frames):
+                    frame = int(frames[i])
+                    nearest = frame if nearest is None else min(nearest, frame)
+
+        if nearest is None:
+            self.report({'INFO'}, "No more Keymesh keyframes in this direction")
+            return {'CANCELLED'}
+
+        context.scene.frame_current = nearest
         return {'FINISHED'}
 
 
+    def _scope_objects(self, context) -> list:
+        if self.scope == 'ACTIVE':
+            objects = [context.active_object] if context.active_object else []
+        elif self.scope == 'SELECTED':
+            objects = context.selected_objects
+        elif self.scope == 'VISIBLE':
+            objects = [obj for obj in get_keymesh_objects(context.scene, context.view_layer) if obj.visible_get()]
+
+        return [obj for obj in objects if is_keymesh_object(obj) and obj.keymesh.animated]
+
+
 
 #### ------------------------------ REGISTRATION ------------------------------ ####
 
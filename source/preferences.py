@@ -1,6 +1,10 @@
 import bpy
 from . import ui
 
+from .functions.profiler import (
+    set_profiling,
+)
+
 
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
@@ -22,6 +26,12 @@ def update_sidebar_category(self, context):
         bpy.utils.register_class(cls)
 
 
+def update_profiler(self, context):
+    """Enable or disable the frame handler profiler."""
+
+    set_profiling(self.debug and self.profile_handler)
+
+
 # Keymaps
 def get_hotkey_entry_item(km, kmi_name, kmi_prop=None, kmi_value=None):
     """Returns keymap with given operator name and `path` property value."""
@@ -165,6 +175,14 @@ class KeymeshAddonPreferences(bpy.types.AddonPreferences):
     debug: bpy.props.BoolProperty(
         name = "Debugging Tools",
         description = "Will expose internal properties and experimental tools in UI for debugging purposes",
+        update = update_profiler,
+        default = False,
+    )
+    profile_handler: bpy.props.BoolProperty(
+        name = "Profile Playback",
+        description = ("Record how much time each Keymesh object takes during playback (works only when debugging tools are enabled).\n"
+                       "NOTE: Measuring has a slight performance impact on its own"),
+        update = update_profiler,
         default = False,
     )
 
@@ -186,6 +204,8 @@ class KeymeshAddonPreferences(bpy.types.AddonPreferences):
         col.prop(self, "enable_shape_keys")
         col.separator()
         col.prop(self, "debug")
+        if self.debug:
+            col.prop(self, "profile_handler")
 
 
         # Keymaps
@@ -126,6 +126,14 @@ class OBJECT_PG_keymesh(bpy.types.PropertyGroup):
         update = keymesh_blocks_list_update,
         default = -1,
     )
+    blocks_next_index: bpy.props.IntProperty(
+        name = "Next Block Index",
+        description = ("Index (`[\"Data\"]` property) that the next Keymesh block will get, i.e. highest index in the registry + 1.\n"
+                       "-1 means it wasn't calculated yet (for files created with older versions of Keymesh)"),
+        options = set(),
+        override = {"LIBRARY_OVERRIDABLE"},
+        default = -1,
+    )
 
     # UI
     grid_view: bpy.props.BoolProperty(
@@ -159,6 +167,24 @@ class SCENE_PG_keymesh(bpy.types.PropertyGroup):
         default = True,
     )
 
+    last_id: bpy.props.IntProperty(
+        name = "Last Keymesh ID",
+        description = ("The last Keymesh ID that was given to an object in this file.\n"
+                       "IDs are never reused, so blocks of removed objects can't be mistaken for blocks of new ones"),
+        options = {'HIDDEN'},
+        default = 0,
+    )
+
+    subframe_switch: bpy.props.EnumProperty(
+        name = "Switch Blocks At",
+        description = "When motion blur evaluates subframes, choose at which moment of the shutter Keymesh blocks are switched",
+        items = (('OPEN', "Shutter Open", ("Subframes use the block of the whole frame they follow.\n"
+                                           "Block is switched exactly on the keyframe, so motion blur of the previous block can be visible")),
+                 ('CENTER', "Shutter Center", ("Subframes use the block of the nearest whole frame.\n"
+                                               "Block is switched half a frame before the keyframe, so the whole shutter shows the same block"))),
+        default = 'OPEN',
+    )
+
     frame_skip_count: bpy.props.IntProperty(
         name = "Frame Count",
         description = "Skip this many frames forwards or backwards when inserting keyframe",
@@ -169,6 +195,15 @@ class SCENE_PG_keymesh(bpy.types.PropertyGroup):
         options = set(),
         default = 2,
     )
+    jump_scope: bpy.props.EnumProperty(
+        name = "Jump Between",
+        description = "Whose Keymesh keyframes are used when jumping to the next or previous Keymesh keyframe",
+        items = (('ACTIVE', "Active Object", "Jump between Keymesh keyframes of the active object"),
+                 ('SELECTED', "Selected Objects", "Jump between Keymesh keyframes of all selected Keymesh objects"),
+                 ('VISIBLE', "Visible Objects", "Jump between Keymesh keyframes of all visible Keymesh objects")),
+        options = set(),
+        default = 'ACTIVE',
+    )
     keyframe_after_skip: bpy.props.BoolProperty(
         name = "Insert Keyframe",
         description = ("Jumping forward or backwards in timeline will also keyframe the object data.\n"
@@ -185,8 +220,7 @@ class SCENE_PG_keymesh(bpy.types.PropertyGroup):
     )
     show_count: bpy.props.BoolProperty(
         name = "Show Usage Count",
-        description = ("Show how many times each Keymesh block has been used in the animation (number of keyframes).\n"
-                       "NOTE: Calculation can be expensive in heavy scenes and it's recommended to be off"),
+        description = "Show how many times each Keymesh block has been used in the animation (number of keyframes)",
         default = True,
     )
 
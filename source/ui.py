@@ -4,8 +4,11 @@ from .functions.poll import (
     is_linked,
     is_keymesh_object,
 )
+from .functions.profiler import (
+    get_stats,
+)
 from .functions.timeline import (
-    keymesh_block_usage_count,
+    get_keymesh_block_usage,
 )
 
 
@@ -203,6 +206,34 @@ class VIEW3D_PT_keymesh_tools(bpy.types.Panel):
                 # panel.separator()
                 # panel.operator("object.keymesh_interpolate", text="INTERPOLATE")
 
+        # profiler
+        if prefs.debug:
+            layout.separator()
+            header, panel = layout.panel("KEYMESH_PT_profiler", default_closed=True)
+            header.label(text="Profiler")
+
+            if panel:
+                panel.prop(prefs, "profile_handler")
+
+                stats = get_stats()
+                if stats:
+                    col = panel.column(align=True)
+                    row = col.row(align=True)
+                    row.label(text="Object")
+                    row.label(text="Avg (ms)")
+                    row.label(text="Swaps")
+                    row.label(text="Hits")
+                    for item in stats[:10]:
+                        row = col.row(align=True)
+                        row.label(text=item["object"])
+                        row.label(text=f"{item['average_ms']:.3f}")
+                        row.label(text=str(item["swaps"]))
+                        row.label(text=f"{item['cache_hits']}/{item['samples']}")
+
+                row = panel.row(align=True)
+                row.operator("scene.keymesh_profiler_export", text="Export", icon='EXPORT')
+                row.operator("scene.keymesh_profiler_clear", text="Clear", icon='TRASH')
+
 
 # SCENE-level
 class SCENE_PT_keymesh(bpy.types.Panel):
@@ -221,6 +252,8 @@ class SCENE_PT_keymesh(bpy.types.Panel):
         props = context.scene.keymesh
 
         layout.prop(props, "enable_handler", text="Keymesh Animation")
+        layout.prop(props, "subframe_switch")
+        layout.prop(props, "jump_scope")
         layout.operator("scene.keymesh_handler_initialize", text="Refresh Frame Handler")
 
 
@@ -235,6 +268,7 @@ class VIEW3D_MT_keymesh_special_menu(bpy.types.Menu):
         layout.operator("object.keymesh_block_extract", icon='FILE_PARENT')
         layout.separator()
         layout.operator("object.keymesh_purge", text="Purge Unused Blocks", icon='TRASH')
+        layout.operator("scene.keymesh_collect_garbage", text="Remove Orphaned Blocks", icon='ORPHAN_DATA')
 
 
 class VIEW3D_MT_keymesh_filter_menu(bpy.types.Menu):
@@ -265,7 +299,7 @@ class VIEW3D_UL_keymesh_blocks(bpy.types.UIList):
 
         # Usage Count
         if context.scene.keymesh.show_count:
-            usage_count, __ = keymesh_block_usage_count(obj, item.block)
+            usage_count = get_keymesh_block_usage(obj).get(item.block.keymesh.get("Data", None), 0)
 
             col = layout.column(align=True)
             col.scale_x = 0.1